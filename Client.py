@@ -2,19 +2,20 @@ from typing import Optional
 import asyncio
 import colorama
 import os
-import json
-import time
 from pathlib import Path
 from .DataHandler import (
     game_paths,
     load_json_file,
-    erase_song_list,
-    song_unlock,
-    generate_modded_paths,
-    create_copies,
     restore_originals,
-    freeplay_song_list,
+    padded_dlc_ids,
 )
+from .ModPVDB import PVDBWriter, pv_key
+from .ModsIndex import mods_index
+from .SlotData import decode_slot_data
+from .Profiling import timed
+from .FileWatcher import FileWatcher
+from .ClientState import ClientState, pv_db_exceptions
+from .SessionCache import SessionCache
 from CommonClient import (
     CommonContext,
     ClientCommandProcessor,
@@ -78,7 +79,7 @@ class MegaMixContext(SuperContext):
         self.game = "Hatsune Miku Project Diva Mega Mix+"
         self.path = game_paths().get("mods")
         self.mod_name = "ArchipelagoMod"
-        self.mod_pv = f"{self.path}/{self.mod_name}/rom/mod_pv_db.txt"
+        self.mod_pv = os.path.join(self.path, self.mod_name, "rom", "mod_pv_db.txt")
         self.songResultsLocation = f"{self.path}/{self.mod_name}/results.json"
         self.deathLinkInLocation = f"{self.path}/{self.mod_name}/death_link_in"
         self.deathLinkOutLocation = f"{self.path}/{self.mod_name}/death_link_out"
@@ -87,41 +88,49 @@ class MegaMixContext(SuperContext):
         self.trapIconLocation = f"{self.path}/{self.mod_name}/icontrap"
         self.modData = None
         self.modded = False
+        self.song_packs: dict[int, str] = {}  # Modded song ID -> pack
+        self.pack_pv_dbs: dict[str, str] = {}  # Pack -> its mod_pv_db.txt, only packs found on connecting
+        self.missing_packs: set[str] = set()  # Packs of this slot not found, warned about once
         self.freeplay = False
+        self.removed_songs: set[int] = set()  # Cleared song IDs hidden with /remove_cleared
+        self.songs_loaded = False  # Location names and pv_dbs of this connection known, songs can be synced
         self.mod_pv_list = []
-        self.previous_received = []
+        self.pv_db_writer = PVDBWriter(() if os.path.isfile(game_paths().get("dlc")) else padded_dlc_ids)
         self.sent_unlock_message = False
 
         self.items_handling = 0b001 | 0b010 | 0b100  #Receive items from other worlds, starting inv, and own items
-        self.location_ids = None
+        self.connected = False
         self.location_name_to_ap_id = None
         self.location_ap_id_to_name = None
         self.item_name_to_ap_id = None
         self.item_ap_id_to_name = None
         self.checks_per_song = 2
-        self.found_checks = []
-        self.missing_checks = []  # Stores all location checks found, for filtering
-        self.prev_found = []
+        self.found_checks = []  # Cleared locations waiting to be sent
+        self.state = ClientState(self.checks_per_song)
 
         self.seed_name = None
+        self.datapackage_checksum = None
+        self.session: Optional[SessionCache] = None
         self.options = None
+        # Connected -> wait for RoomInfo's seed -> find pv_dbs (off the loop) -> session cache or GetDataPackage -> resync
+        self.room_info_received = asyncio.Event()
+        self.connection_task: Optional[asyncio.Task] = None
 
         self.goal_song = None
         self.goal_id = None
         self.autoRemove = False
         self.leeks_needed = 0
-        self.leeks_obtained = 0
         self.leek_label = None
         self.grade_needed = None
         self.death_link = False
         self.death_link_amnesty = 0
         self.death_link_amnesty_count = 0
 
-        self.watch_task = None
-        if not self.watch_task:
-            self.watch_task = asyncio.create_task(self.watch_json_file(self.songResultsLocation))
-
-        self.watch_death_link_task = None
+        # Song results and Death Link are signalled by the mod writing files in its folder
+        self.file_watcher = FileWatcher(os.path.join(self.path, self.mod_name))
+        self.file_watcher.watch(os.path.basename(self.songResultsLocation), self.on_song_results)
+        self.file_watcher.watch(os.path.basename(self.deathLinkOutLocation), self.on_death_link_out)
+        self.file_watcher.start()
 
         self.obtained_items_queue = asyncio.Queue()
         self.critical_section_lock = asyncio.Lock()
@@ -138,37 +147,34 @@ class MegaMixContext(SuperContext):
         if cmd == "Connected":
 
             self.sent_unlock_message = False
-            self.leeks_obtained = 0
-            self.missing_checks = args["missing_locations"]
-            self.prev_found = args["checked_locations"]
-            self.location_ids = set(args["missing_locations"] + args["checked_locations"])
-            self.options = args["slot_data"]
+            self.state.clear_received()
+            self.connected = True
+            self.songs_loaded = False
+            self.removed_songs.clear()
+            self.state.connect(args["missing_locations"], args["checked_locations"])
+            self.options = decode_slot_data(args["slot_data"])
             self.goal_song = self.options["victoryLocation"]
             self.goal_id = self.options["victoryID"]
             self.autoRemove = self.options["autoRemove"]
             self.leeks_needed = self.options["leekWinCount"]
             self.grade_needed = int(self.options["scoreGradeNeeded"])
             self.modData = self.options["modData"]
-            if self.modData:
-                self.modded = True
-                self.mod_pv_list = generate_modded_paths(self.modData, self.path)
-            self.mod_pv_list.append(self.mod_pv)
-            create_copies(self.mod_pv_list)
-            asyncio.create_task(self.send_msgs([{"cmd": "GetDataPackage", "games": ["Hatsune Miku Project Diva Mega Mix+"]}]))
+            self.modded = bool(self.modData)
+            self.song_packs = {}
+            for pack, ids in (self.modData or {}).items():
+                for song_id in ids:
+                    self.song_packs.setdefault(song_id, pack)
 
             self.death_link = self.options.get("deathLink", False)
             self.death_link_amnesty = self.options.get("deathLink_Amnesty", 0)
             self.death_link_amnesty_count = 0
             asyncio.create_task(self.update_death_link(self.death_link))
 
-            if self.death_link and not self.watch_death_link_task:
-                self.watch_death_link_task = asyncio.create_task(self.watch_death_link_out(self.deathLinkOutLocation))
-
             self.check_goal()
 
-            # if we don't have the seed name from the RoomInfo packet, wait until we do.
-            while not self.seed_name:
-                time.sleep(1)
+            if self.connection_task:
+                self.connection_task.cancel()
+            self.connection_task = asyncio.create_task(self.setup_connection())
 
         if cmd == "ReceivedItems":
             # If receiving an item, only append that item
@@ -176,64 +182,135 @@ class MegaMixContext(SuperContext):
 
         if cmd == "RoomInfo":
             self.seed_name = args['seed_name']
+            self.datapackage_checksum = args.get("datapackage_checksums", {}).get(self.game)
+            self.room_info_received.set()
 
         elif cmd == "DataPackage":
-            if not self.location_ids:
+            if not self.connected:
                 # Connected package not recieved yet, wait for datapackage request after connected package
                 return
-            self.leeks_obtained = 0
-            self.previous_received = []
 
-            self.location_name_to_ap_id = args["data"]["games"]["Hatsune Miku Project Diva Mega Mix+"]["location_name_to_id"]
-            self.location_name_to_ap_id = {
+            game_data = args["data"]["games"]["Hatsune Miku Project Diva Mega Mix+"]
+            location_name_to_ap_id = {
                 name: loc_id for name, loc_id in
-                self.location_name_to_ap_id.items() if loc_id in self.location_ids
+                game_data["location_name_to_id"].items() if loc_id // 10 in self.state.songs
+            }
+            # Only this slot's songs can be received, besides the static items
+            item_name_to_ap_id = {
+                name: item_id for name, item_id in
+                game_data["item_name_to_id"].items() if item_id < 10 or item_id // 10 in self.state.songs
             }
-            self.location_ap_id_to_name = {v: k for k, v in self.location_name_to_ap_id.items()}
-            self.item_name_to_ap_id = args["data"]["games"]["Hatsune Miku Project Diva Mega Mix+"]["item_name_to_id"]
-            self.item_ap_id_to_name = {v: k for k, v in self.item_name_to_ap_id.items()}
 
-            erase_song_list(self.mod_pv_list)
-            # If receiving data package, resync previous items
-            asyncio.create_task(self.receive_item())
+            self.session = None
+            if self.seed_name and self.datapackage_checksum:
+                self.session = SessionCache(self.seed_name, self.slot, self.datapackage_checksum)
+                self.session.location_name_to_id = location_name_to_ap_id
+                self.session.item_name_to_id = item_name_to_ap_id
+                asyncio.create_task(self.save_session())
 
-    def song_id_to_pack(self, item_id):
-        target_song_id = int(item_id) // 10
+            self.load_locations(location_name_to_ap_id, item_name_to_ap_id)
+
+    def load_locations(self, location_name_to_ap_id: dict[str, int], item_name_to_ap_id: dict[str, int]):
+        """Take the slot's location and item names, then resync every received item."""
+        self.state.clear_received()
+
+        self.location_name_to_ap_id = location_name_to_ap_id
+        self.location_ap_id_to_name = {v: k for k, v in location_name_to_ap_id.items()}
+        self.item_name_to_ap_id = item_name_to_ap_id
+        self.item_ap_id_to_name = {v: k for k, v in item_name_to_ap_id.items()}
+
+        self.songs_loaded = True
+        asyncio.create_task(self.receive_item())
+
+    async def save_session(self):
+        if self.session:
+            self.session.pv_dbs = dict(self.pv_db_writer.applied)
+            await asyncio.to_thread(self.session.save)
 
+    async def setup_connection(self):
+        """Rest of the Connected handling, without blocking the event loop."""
+        # The server sends RoomInfo first, but the seed is needed before going further.
+        await self.room_info_received.wait()
+
+        pack_pv_dbs = {}
         if self.modded:
-            for pack, ids in self.modData.items():
-                if target_song_id in ids:
-                    return pack
-        return "ArchipelagoMod"
+            # On the writer's thread, like restore_songs, so the index is never refreshed from two threads at once
+            pack_pv_dbs = await self.pv_db_writer.run(lambda: mods_index().refresh().pack_pv_db_paths(self.modData))
+        self.mod_pv_list = list(pack_pv_dbs.values()) + [self.mod_pv]
+        self.pack_pv_dbs = {**pack_pv_dbs, self.mod_name: self.mod_pv}
+        self.missing_packs = set()
+
+        session = await asyncio.to_thread(SessionCache.load, self.seed_name, self.slot, self.datapackage_checksum)
+        if session:
+            logger.debug(f"Reusing the session cache of seed {self.seed_name}")
+            self.session = session
+            for file_path, state in session.pv_dbs.items():
+                self.pv_db_writer.applied.setdefault(file_path, state)
+            self.load_locations(session.location_name_to_id, session.item_name_to_id)
+            return
+
+        await self.send_msgs([{"cmd": "GetDataPackage", "games": ["Hatsune Miku Project Diva Mega Mix+"]}])
+
+    def song_id_to_pack(self, item_id):
+        return self.song_packs.get(int(item_id) // 10, self.mod_name)
+
+    def pack_to_pv_db(self, song_pack: str) -> Optional[str]:
+        """The pack's pv_db found on connecting, None if the pack is not installed."""
+        pv_db = self.pack_pv_dbs.get(song_pack)
+        if pv_db is None and song_pack not in self.missing_packs:
+            self.missing_packs.add(song_pack)
+            logger.warning(f"Song pack {song_pack} is not installed, its songs can't be unlocked")
+        return pv_db
+
+    @timed()
+    def sync_songs(self):
+        """
+        Queue the wanted state of every pv_db, worked out from scratch:
+          received songs, less cleared ones when removed, and the goal song once unlocked
+          or in freeplay, every song but the unreceived ones and the locked goal song
+        DLC songs are disabled by the writer when the DLC is missing. Files already as wanted are not written.
+        """
+        if not self.songs_loaded:
+            return
 
+        hidden = (self.removed_songs | self.state.cleared_songs()) if self.autoRemove else self.removed_songs
+        songs = self.state.exception_songs(self.freeplay, self.goal_id // 10,
+                                           self.leeks_obtained >= self.leeks_needed, hidden)
+        pv_dbs = pv_db_exceptions(self.mod_pv_list, songs, self.freeplay,
+                                  lambda song_id: self.pack_to_pv_db(self.song_id_to_pack(song_id * 10)))
+
+        for pv_db, song_ids in pv_dbs.items():
+            self.pv_db_writer.set_state(pv_db, self.freeplay, song_ids)
+
+    @timed()
     async def receive_item(self):
         async with self.critical_section_lock:
-            ids_to_packs = {}
-
-            for network_item in self.items_received:
-                if network_item not in self.previous_received:
-                    self.previous_received.append(network_item)
-                    if network_item.item == 1:
-                        self.leeks_obtained += 1
-                        self.check_goal()
-                    elif network_item.item == 2:
-                        # Maybe move static items out of MegaMixCollection instead of hard coding?
-                        pass
-                    elif network_item.item == 4:
-                        if not os.path.isfile(self.trapHiddenLocation):
-                            Path(self.trapHiddenLocation).touch()
-                    elif network_item.item == 5:
-                        if not os.path.isfile(self.trapSuddenLocation):
-                            Path(self.trapSuddenLocation).touch()
-                    elif network_item.item == 9:
-                        if not os.path.isfile(self.trapIconLocation):
-                            Path(self.trapIconLocation).touch()
-                    else:
-                        ids_to_packs.setdefault(self.song_id_to_pack(network_item.item), set()).add(network_item.item)
-
-            for song_pack in ids_to_packs:
-                song_unlock(self.path, ids_to_packs.get(song_pack), False, song_pack)
-
+            new_items = self.state.take_received(self.items_received)
+
+            for network_item in new_items:
+                if network_item.item == 1:
+                    self.check_goal()
+                elif network_item.item == 2:
+                    # Maybe move static items out of MegaMixCollection instead of hard coding?
+                    pass
+                elif network_item.item == 4:
+                    if not os.path.isfile(self.trapHiddenLocation):
+                        Path(self.trapHiddenLocation).touch()
+                elif network_item.item == 5:
+                    if not os.path.isfile(self.trapSuddenLocation):
+                        Path(self.trapSuddenLocation).touch()
+                elif network_item.item == 9:
+                    if not os.path.isfile(self.trapIconLocation):
+                        Path(self.trapIconLocation).touch()
+
+            # Also on a resync that received nothing, to set up the pv_dbs
+            if new_items or not self.state.received_index:
+                self.sync_songs()
+
+
+    @property
+    def leeks_obtained(self) -> int:
+        return self.state.leeks
 
     def check_goal(self):
         if not self.leek_label:
@@ -247,43 +324,16 @@ class MegaMixContext(SuperContext):
                 self.sent_unlock_message = True
                 logger.info(f"Got enough leeks! Unlocking goal song: {self.goal_song}")
 
-            song_pack = self.song_id_to_pack(self.goal_id)
-            song_unlock(self.path, {self.goal_id}, False, song_pack)
-
-
-    async def watch_json_file(self, file_name: str):
-        """Watch a JSON file for changes and call the callback function."""
-        file_path = os.path.join(os.path.dirname(__file__), file_name)
-        last_modified = os.path.getmtime(file_path) if os.path.isfile(file_path) else 0.0
-        try:
-            while True:
-                await asyncio.sleep(1)  # Wait for a short duration
-                if os.path.isfile(file_path):
-                    modified = os.path.getmtime(file_path)
-                    if modified > last_modified:
-                        last_modified = modified
-                        try:
-                            json_data = load_json_file(file_name)
-                            await self.receive_location_check(json_data)
-                        except (FileNotFoundError, json.JSONDecodeError) as e:
-                            print(f"Error loading JSON file: {e}")
-        except asyncio.CancelledError:
-            print(f"Watch task for {file_name} was canceled.")
-
-
-    async def watch_death_link_out(self, file_name: str):
-        file_path = os.path.join(os.path.dirname(__file__), file_name)
-        last_modified = os.path.getmtime(file_path) if os.path.isfile(file_path) else 0.0
-
-        logger.debug(f"Watching {self.deathLinkOutLocation} ({last_modified})")
-
-        while True:
-            await asyncio.sleep(0.25)
-            if os.path.isfile(file_path):
-                modified = os.path.getmtime(file_path)
-                if modified > last_modified:
-                    last_modified = modified
-                    await self.send_death()
+
+    async def on_song_results(self, file_path: str):
+        """results.json was written by the mod after a song."""
+        json_data = load_json_file(file_path)
+        if json_data:  # Empty if unreadable, i.e. caught mid-write
+            await self.receive_location_check(json_data)
+
+    async def on_death_link_out(self, file_path: str):
+        """death_link_out was touched by the mod. Ignored by send_death while Death Link is off."""
+        await self.send_death()
 
 
     async def send_death(self, death_text: str = ""):
@@ -311,15 +361,15 @@ class MegaMixContext(SuperContext):
             logger.info("No checks to send at BK but seeing this means your Client is OK!")
             return
 
-        location_id = int(song_data.get('pvId') * 10)
-        location_checks = set(range(location_id, location_id + self.checks_per_song))
+        song_id = int(song_data.get('pvId'))
+        location_id = song_id * 10
 
         if not location_id == self.goal_id:
-            if location_checks.issubset(set(self.prev_found)):
+            if self.state.is_cleared(song_id):
                 logger.info("No checks to send: Song checks previously sent or collected")
                 return
 
-            if not location_id in self.location_ids:
+            if song_id not in self.state.songs:
                 logger.info("No checks to send: Song not in song pool")
                 return
 
@@ -330,8 +380,7 @@ class MegaMixContext(SuperContext):
 
             logger.info("Cleared song with appropriate grade!")
 
-            for i in range(2):
-                self.found_checks.append(location_id + i)
+            self.found_checks.extend(self.state.song_locations(song_id))
 
             asyncio.create_task(self.send_checks())
         else:
@@ -359,42 +408,19 @@ class MegaMixContext(SuperContext):
             await self.remove_songs()
 
     def remove_found_checks(self):
-        self.prev_found += self.found_checks
-        self.missing_checks = [item for item in self.missing_checks if item not in self.found_checks]
+        self.state.mark_found(self.found_checks)
 
     async def get_uncleared(self):
+        uncleared = self.state.uncleared_songs()
 
-        prev_items = []
-        missing_locations = set()  # Convert to set if it's not already
-        logged_pairs = set()  # To keep track of logged pairs
-
-        # Get a list of all item names that have been received
-        for network_item in self.previous_received:
-            item_id = network_item.item // 10
-            prev_items.append(item_id)
-
-        for location in self.missing_checks:
-            # Change location name to match item name
-            if location not in missing_locations:
-                if location // 10 in prev_items:
-                    missing_locations.add(location)
-
-        # Now log pairs of locations
-        for location in missing_locations:
-            pair_last_digit = location % 2
-            paired_location = location - pair_last_digit + (1 - pair_last_digit)  # Flip last digit
-
-            # Only log if the pair hasn't been logged yet
-            pair_key = (min(location, paired_location), max(location, paired_location))
-            if pair_key not in logged_pairs:
-                logger.info(f"{self.location_ap_id_to_name[location][:-2]} is uncleared")
-                logged_pairs.add(pair_key)
+        for song_id in sorted(uncleared):
+            logger.info(f"{self.location_ap_id_to_name[song_id * 10][:-2]} is uncleared")
 
         if self.leeks_obtained >= self.leeks_needed:
             logger.info(f"Goal song: {self.goal_song} is unlocked.")
 
         # Check goal and if missingLocations is empty
-        if not missing_locations:
+        if not uncleared:
             logger.info("All available songs cleared")
 
     async def get_leek_info(self):
@@ -411,32 +437,15 @@ class MegaMixContext(SuperContext):
             logger.info("Auto Remove Set to Off")
 
     async def remove_songs(self):
-        finished_songs = self.prev_found[::self.checks_per_song]
-
-        ids_to_packs = {}
-        for item in finished_songs:
-            ids_to_packs.setdefault(self.song_id_to_pack(item), []).append(item)
-
-        for song_pack in ids_to_packs:
-            song_unlock(self.path, ids_to_packs.get(song_pack), True, song_pack)
+        self.removed_songs |= self.state.cleared_songs()
+        self.sync_songs()
 
         logger.info("Removed songs!")
 
+    @timed()
     async def freeplay_toggle(self):
         self.freeplay = not self.freeplay
-
-        song_ids = {location_id for location_id in sorted(self.location_ids)[::self.checks_per_song]
-                    if location_id not in [i.item for i in self.previous_received]}
-
-        if not self.freeplay:
-            song_ids = {received.item for received in self.previous_received if received.item in self.missing_checks}
-
-            if self.leeks_obtained >= self.leeks_needed:
-                song_ids.add(self.goal_id)
-        elif self.leeks_obtained < self.leeks_needed:
-            song_ids.add(self.goal_id)
-
-        freeplay_song_list(self.mod_pv_list, song_ids, self.freeplay)
+        self.sync_songs()
 
         if self.freeplay:
             logger.info("Restored non-AP songs!")
@@ -444,10 +453,21 @@ class MegaMixContext(SuperContext):
             logger.info("Removed non-AP songs!")
 
     async def restore_songs(self):
-        mod_pv_dbs = [f"{root}/mod_pv_db.txt" for root, _, files in os.walk(self.path) if 'mod_pv_db.txt' in files]
-        restore_originals(mod_pv_dbs)
+        self.pv_db_writer.discard()
+        await self.pv_db_writer.run(lambda: restore_originals(mods_index().refresh().pv_db_paths()))
+
+    async def connection_closed(self):
+        """On disconnects and dropped connections. The next connection waits for its own RoomInfo."""
+        self.connected = False
+        self.room_info_received.clear()
+        if self.connection_task:
+            self.connection_task.cancel()
+            self.connection_task = None
+        await self.save_session()
+        await super().connection_closed()
 
     async def shutdown(self):
+        self.file_watcher.stop()
         await self.restore_songs()
         await super().shutdown()
 
@@ -463,11 +483,6 @@ class MegaMixContext(SuperContext):
             logger.info(f"Death Link is now {['off','on'][self.death_link]}")
             await self.update_death_link(self.death_link)
 
-        # This is for when DL is disabled in the YAML and opted into with the Client.
-        # TODO: The copy of this in on_package should be reworked.
-        if self.death_link and not self.watch_death_link_task:
-            self.watch_death_link_task = asyncio.create_task(self.watch_death_link_out(self.deathLinkOutLocation))
-
 
 def launch():
     """
@@ -0,0 +1,124 @@
+from typing import Callable, Iterable, Optional, Sequence
+
+from .ModPVDB import pv_key
+
+LEEK_ID = 1
+
+
+class ClientState:
+    """
+    Progress of the connected slot, kept as sets so every update and lookup is O(1) per song.
+
+    Songs are keyed by song ID: item ID // 10, and location ID // 10 for each of its checks_per_song locations.
+    """
+
+    def __init__(self, checks_per_song: int = 2) -> None:
+        self.checks_per_song = checks_per_song
+        self.missing_locations: set[int] = set()
+        self.found_locations: set[int] = set()
+        self.songs: set[int] = set()  # Songs with locations in this slot
+        self.missing_songs: set[int] = set()  # Songs with at least one location left
+        self.received_songs: set[int] = set()
+        self.received_index = 0  # Items of items_received already taken
+        self.leeks = 0
+
+    def connect(self, missing_locations: Iterable[int], checked_locations: Iterable[int]) -> None:
+        """Start over from the locations of a Connected package. Received songs are kept."""
+        self.missing_locations = set(missing_locations)
+        self.found_locations = set(checked_locations)
+        self.missing_songs = {location_id // 10 for location_id in self.missing_locations}
+        self.songs = self.missing_songs | {location_id // 10 for location_id in self.found_locations}
+
+    def song_locations(self, song_id: int) -> range:
+        return range(song_id * 10, song_id * 10 + self.checks_per_song)
+
+    def mark_found(self, location_ids: Iterable[int]) -> None:
+        for location_id in location_ids:
+            self.missing_locations.discard(location_id)
+            self.found_locations.add(location_id)
+
+            song_id = location_id // 10
+            if song_id in self.missing_songs and self.missing_locations.isdisjoint(self.song_locations(song_id)):
+                self.missing_songs.discard(song_id)
+
+    def receive_song(self, item_id: int) -> None:
+        self.received_songs.add(item_id // 10)
+
+    def take_received(self, items: Sequence) -> Sequence:
+        """
+        Items of the server's items_received not taken yet, counting Leeks and songs (item ID 10 and up).
+        Starts over when the list got shorter, as the server resent everything.
+        """
+        if len(items) < self.received_index:
+            self.clear_received()
+
+        new_items = items[self.received_index:]
+        self.received_index += len(new_items)
+
+        for item in new_items:
+            if item.item == LEEK_ID:
+                self.leeks += 1
+            elif item.item >= 10:
+                self.receive_song(item.item)
+        return new_items
+
+    def clear_received(self) -> None:
+        """Take every item again on the next take_received."""
+        self.received_index = 0
+        self.leeks = 0
+        self.received_songs.clear()
+
+    def is_cleared(self, song_id: int) -> bool:
+        """All of the song's locations were checked or collected."""
+        return song_id in self.songs and song_id not in self.missing_songs
+
+    def cleared_songs(self) -> set[int]:
+        return self.songs - self.missing_songs
+
+    def uncleared_songs(self) -> set[int]:
+        """Received songs with locations left."""
+        return self.received_songs & self.missing_songs
+
+    def unreceived_songs(self) -> set[int]:
+        """Songs of this slot not received yet."""
+        return self.songs - self.received_songs
+
+    def exception_songs(self, freeplay: bool, goal_song: int, goal_unlocked: bool, hidden: Iterable[int] = ()) -> set[int]:
+        """
+        Songs set apart from every other song of the pv_dbs:
+          the ones to enable, received songs less hidden ones, and the goal song once unlocked
+          or in freeplay the ones to disable, unreceived songs and the locked goal song
+        """
+        if freeplay:
+            songs = self.unreceived_songs()
+            if goal_unlocked:
+                songs.discard(goal_song)
+            else:
+                songs.add(goal_song)
+        else:
+            songs = self.received_songs - set(hidden)
+            if goal_unlocked:
+                songs.add(goal_song)
+        return songs
+
+
+def pv_db_exceptions(pv_dbs: Iterable[str], songs: Iterable[int], freeplay: bool,
+                     song_pv_db: Callable[[int], Optional[str]]) -> dict[str, set[str]]:
+    """
+    Padded IDs of exception_songs() per pv_db.
+    In freeplay every pv_db disables all of them, as an ID can be in several pv_dbs (covers, ArchipelagoMod entries).
+    Otherwise each song is only enabled in its own pack's pv_db, given by song_pv_db, and skipped when that is None.
+    """
+    exceptions = {pv_db: set() for pv_db in pv_dbs}
+
+    if freeplay:
+        song_ids = {pv_key(song_id) for song_id in songs}
+        for pv_db in exceptions:
+            exceptions[pv_db] = set(song_ids)
+        return exceptions
+
+    for song_id in songs:
+        pv_db = song_pv_db(song_id)
+        if pv_db:
+            exceptions.setdefault(pv_db, set()).add(pv_key(song_id))
+    return exceptions
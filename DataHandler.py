@@ -1,4 +1,5 @@
 import functools
+import hashlib
 import json
 import yaml
 import re
@@ -9,14 +10,19 @@ import settings
 import Utils
 import logging
 import filecmp
-from typing import Any
+import multiprocessing
+from typing import Any, Optional
 
 from .MegaMixSongData import dlc_ids
+from .ModPVDB import ModPVDB, PVDBJournal, pv_key
+from .Profiling import timed
 
 # Set up logger
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+padded_dlc_ids = frozenset(pv_key(song_id) for song_id in dlc_ids)
+
 @functools.cache
 def game_paths() -> dict[str, str]:
     """Build relevant paths based on the game exe and, if available, the mod loader config."""
@@ -55,29 +61,17 @@ def load_json_file(file_name: str) -> dict:
         return {}
 
 
-def create_copies(file_paths):
-    for file_path in file_paths:
-        # Get the directory and filename from the file path
-        directory, filename = os.path.split(file_path)
-
-        # Create the new filename by appending "COPY" before the file extension
-        name, ext = os.path.splitext(filename)
-        new_filename = f"{name}COPY{ext}"
-
-        # Create the full path for the new file
-        new_file_path = os.path.join(directory, new_filename)
-
-        # Check if the file already exists
-        if not os.path.exists(new_file_path):
-            # Copy the file to the new path
-            shutil.copyfile(file_path, new_file_path)
-            logger.debug(f"Copied {file_path} to {new_file_path}")
-        else:
-            logger.debug(f"File {new_file_path} already exists. Skipping...")
-
-
 def restore_originals(original_file_paths):
+    """Revert lines changed by the client using each pv_db's journal. Falls back to COPY files of older versions."""
     for original_file_path in original_file_paths:
+        journal = PVDBJournal.load(original_file_path)
+        if journal:
+            if journal.restore():
+                logger.debug(f"Restored {original_file_path} from {journal.journal_path(original_file_path)}")
+            else:
+                logger.debug(f"Skipping restore on {original_file_path} (matches snapshot)")
+            continue
+
         directory, filename = os.path.split(original_file_path)
         name, ext = os.path.splitext(filename)
         copy_filename = f"{name}COPY{ext}"
@@ -90,85 +84,99 @@ def restore_originals(original_file_paths):
             else:
                 logger.debug(f"Skipping restore on {original_file_path} (matches copy)")
         else:
-            logger.debug(f"The copy file {copy_file_path} does not exist.")
+            logger.debug(f"No journal or copy for {original_file_path}, nothing to restore.")
 
 
 # Data processing
-def generate_modded_paths(processed_data, base_path):
-    # Extract unique pack names from processed_data
-    logger.debug(processed_data)
-    unique_pack_names = {pack_name for pack_name, songs in processed_data.items()}
-    logger.debug(unique_pack_names)
-    # Create modded paths based on the unique pack names
-    modded_paths = {f"{base_path}/{pack_name}/rom/mod_pv_db.txt" for pack_name in unique_pack_names}
-    return list(modded_paths)
-
-
-def freeplay_song_list(file_paths, skip_ids: set[int], freeplay: bool):
-    processed_ids = "|".join([str(x // 10).zfill(3) for x in skip_ids])
-    has_dlc = os.path.isfile(game_paths().get("dlc"))
-
-    for file_path in file_paths:
-        with open(file_path, 'r+', encoding='utf-8') as file:
-            file_data = file.read()
-            if freeplay:
-                file_data = modify_mod_pv(file_data, rf"(?!({processed_ids})\.)\d+")
-                file_data = remove_song(file_data, processed_ids)
-            else:
-                file_data = modify_mod_pv(file_data, processed_ids)
-                file_data = remove_song(file_data, rf"(?!({processed_ids})\.)\d+")
-            if not has_dlc:
-                padded_dlc_ids = "|".join([str(x).zfill(3) for x in dlc_ids])
-                file_data = remove_song(file_data, padded_dlc_ids)
-            file.seek(0)
-            file.write(file_data)
-            file.truncate()
+def modify_mod_pv(pv_db: str, songs: str) -> str:
+    """Enable the given "|" separated padded IDs in pv_db text."""
+    mod_pv_db = ModPVDB(pv_db)
+    mod_pv_db.enable(songs.split("|"))
+    return mod_pv_db.text
 
 
-def erase_song_list(file_paths):
-    for file_path in file_paths:
-        with open(file_path, 'r+', encoding='utf-8') as file:
-            file_data = remove_song(file.read(), r"\d+")
-            file.seek(0)
-            file.write(file_data)
-            file.truncate()
+def remove_song(pv_db: str, songs: str) -> str:
+    """Disable the given "|" separated padded IDs in pv_db text."""
+    mod_pv_db = ModPVDB(pv_db)
+    mod_pv_db.disable(songs.split("|"))
+    return mod_pv_db.text
 
 
-def song_unlock(file_path: str, item_id: set, locked: bool, song_pack: str):
-    """Unlock a song based on its id"""
+# Search text for the specific game
+MOD_DATA_GAME = "Hatsune Miku Project Diva Mega Mix+"
+# Regex pattern to capture the outermost curly braces content
+MOD_DATA_PATTERN = re.compile(r"megamix_mod_data:\s*(?:#.*\n)?\s*('.*')")
+MOD_DATA_CACHE_VERSION = 1
+# Below this many uncached YAMLs, starting worker processes costs more than parsing in place.
+MOD_DATA_POOL_THRESHOLD = 32
 
-    song_ids = "|".join([str(x // 10).zfill(3) for x in item_id])
-    if song_pack is not None:
-        file_path = f"{file_path}/{song_pack}/rom/mod_pv_db.txt"
 
-    with open(file_path, 'r+', encoding='utf-8') as file:
-        pv_db = file.read()
+def mod_data_pool_available() -> bool:
+    """
+    Worker processes are only used where they fork. Spawned workers (Windows, macOS, frozen builds)
+    would import every world again just to unpickle the parser, costing more than the parsing itself.
+    """
+    if (os.cpu_count() or 1) < 2 or getattr(sys, "frozen", False):
+        return False
+    # Without allow_none, reading the start method would also fix it for the whole process.
+    start_method = multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+    return start_method == "fork"
 
-        if locked:
-            pv_db = remove_song(pv_db, song_ids)
-        else:
-            pv_db = modify_mod_pv(pv_db, song_ids)
 
-        if not os.path.isfile(game_paths().get("dlc")):
-            padded_dlc_ids = "|".join([str(x).zfill(3) for x in dlc_ids])
-            pv_db = remove_song(pv_db, padded_dlc_ids)
+def extract_file_mod_data(item_path: str, known_hash: Optional[str] = None) -> tuple[str, Optional[list[Any]]]:
+    """
+    Read a single player file, returning its content hash and every megamix_mod_data in it. Parses the file once.
+    Returns None for the mod data without parsing if the content hash matches known_hash.
+    """
+    with open(item_path, 'r', encoding='utf-8') as file:
+        file_content = file.read()
 
-        file.seek(0)
-        file.write(pv_db)
-        file.truncate()
+    content_hash = hashlib.sha1(file_content.encode("utf-8")).hexdigest()
+    if content_hash == known_hash:
+        return content_hash, None
 
+    mod_data = []
 
-def modify_mod_pv(pv_db: str, songs: str) -> str:
-    return re.sub(rf"^#ARCH#(pv_({songs})\.difficulty\.(?:easy|normal|hard|extreme).length=\d)$", r"\g<1>", pv_db, flags=re.MULTILINE)
+    # Check if the search text (game title) is found in the file, then for any 'megamix_mod_data:' block
+    if MOD_DATA_GAME in file_content and MOD_DATA_PATTERN.search(file_content):
+        for single_yaml in yaml.load_all(file_content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+            mod_data_content = single_yaml.get(MOD_DATA_GAME, {}).get("megamix_mod_data", None)
 
+            if isinstance(mod_data_content, dict) or not mod_data_content:
+                continue
 
-def remove_song(pv_db: str, songs: str) -> str:
-    return re.sub(rf"^(pv_(?!(144|700)\.)({songs})\.difficulty\.(?:easy|normal|hard|extreme).length=\d)$", r"#ARCH#\g<1>", pv_db, flags=re.MULTILINE)
+            mod_data.append(json.loads(mod_data_content))
+
+    return content_hash, mod_data
 
 
+def load_mod_data_cache(cache_file: str, folder_path: str) -> dict[str, dict]:
+    cache = load_json_file(cache_file) if os.path.isfile(cache_file) else {}
+    if cache.get("version") != MOD_DATA_CACHE_VERSION or cache.get("folder") != folder_path:
+        return {}
+    return cache.get("files", {})
+
+
+def mod_data_wanted() -> bool:
+    """
+    Whether modded songs should be extracted from the Players folder, which is only needed to generate.
+    Skipped in the Launcher, servers and anything the Launcher starts as a subprocess (Client, JSON Generator).
+    """
+    if "--player_files_path" in sys.argv:
+        return True
+
+    if multiprocessing.parent_process() is not None:
+        return False
+
+    entry_point = os.path.basename(sys.argv[0]).lower() if sys.argv else ""
+    return not any(name in entry_point for name in ("launcher", "server", "webhost"))
+
+
+@timed()
 def extract_mod_data_to_json() -> list[Any]:
     """
     Extracts mod data from YAML files and converts it to a list of dictionaries.
+    Results are cached per file, reused while its mtime and size match or, failing that, its content hash.
     """
 
     user_path = Utils.user_path(settings.get_settings().generator.player_files_path)
@@ -176,49 +184,83 @@ def extract_mod_data_to_json() -> list[Any]:
 
     logger.debug(f"Checking YAMLs for megamix_mod_data at {folder_path}")
 
-    # Search text for the specific game
-    search_text = "Hatsune Miku Project Diva Mega Mix+"
-
-    # Regex pattern to capture the outermost curly braces content
-    mod_data_pattern = r"megamix_mod_data:\s*(?:#.*\n)?\s*('.*')"
-
     # Initialize an empty list to collect all inputs
     all_mod_data = []
 
     if not os.path.isdir(folder_path):
         logger.debug(f"The path {folder_path} is not a valid directory. Modded songs are unavailable for this path.")
-    else:
-        for item in os.listdir(folder_path):
-            item_path = os.path.join(folder_path, item)
+        return all_mod_data
+
+    cache_file = Utils.cache_path("megamix", "mod_data_cache.json")
+    cached = load_mod_data_cache(cache_file, folder_path)
+    files = {}
+    cold = {}
+
+    with os.scandir(folder_path) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if not entry.is_file():
+                continue
+
+            stat = entry.stat()
+            entry_cache = cached.get(entry.name)
+            if entry_cache and entry_cache["mtime"] == stat.st_mtime_ns and entry_cache["size"] == stat.st_size:
+                files[entry.name] = entry_cache
+            else:
+                cold[entry.name] = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+    cached_count = len(files)
+
+    if cold:
+        paths = [os.path.join(folder_path, item) for item in cold]
+        known_hashes = [cached.get(item, {}).get("hash") for item in cold]
+        results = None
+
+        if len(cold) >= MOD_DATA_POOL_THRESHOLD and mod_data_pool_available():
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(mp_context=multiprocessing.get_context("fork")) as executor:
+                    results = list(executor.map(safe_extract_file_mod_data, paths, known_hashes, chunksize=8))
+            except Exception as e:
+                logger.debug(f"Falling back to parsing player files in process: {e}")
 
-            if os.path.isfile(item_path):
-                try:
-                    with open(item_path, 'r', encoding='utf-8') as file:  # Open the file in read mode
-                        file_content = file.read()
+        if results is None:
+            results = [safe_extract_file_mod_data(path, known_hash) for path, known_hash in zip(paths, known_hashes)]
 
-                        # Check if the search text (game title) is found in the file
-                        if search_text in file_content:
-                            # Search for all occurrences of 'megamix_mod_data:' and the block within {}
-                            matches = re.findall(mod_data_pattern, file_content)
+        for (item, entry_cache), (content_hash, mod_data) in zip(cold.items(), results):
+            if content_hash is None:
+                logger.warning(f"Failed to extract mod data from {item}\n{mod_data}")
+                continue
 
-                            # Process each mod_data block
-                            for _ in matches:
-                                for single_yaml in yaml.safe_load_all(file_content):
-                                    mod_data_content = single_yaml.get("Hatsune Miku Project Diva Mega Mix+", {}).get("megamix_mod_data", None)
+            if mod_data is None:  # Touched but unchanged
+                mod_data = cached[item]["mod_data"]
+                cached_count += 1
 
-                                    if isinstance(mod_data_content, dict) or not mod_data_content:
-                                        continue
+            files[item] = {**entry_cache, "hash": content_hash, "mod_data": mod_data}
 
-                                    all_mod_data.append(json.loads(mod_data_content))
-                except Exception as e:
-                    logger.warning(f"Failed to extract mod data from {item}\n{e}")
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as file:
+                json.dump({"version": MOD_DATA_CACHE_VERSION, "folder": folder_path, "files": files}, file)
+        except OSError as e:
+            logger.debug(f"Could not save mod data cache: {e}")
+
+    for item in sorted(files):
+        all_mod_data.extend(files[item]["mod_data"])
 
     total = sum(len(pack) for packList in all_mod_data for pack in packList.values())
-    logger.debug(f"Found {total} songs")
+    logger.debug(f"Found {total} songs ({len(files) - cached_count} player files parsed, {cached_count} cached)")
 
     return all_mod_data
 
 
+def safe_extract_file_mod_data(item_path: str, known_hash: Optional[str] = None) -> tuple[Optional[str], Any]:
+    """extract_file_mod_data for the pool. Failures are returned as (None, error) to be logged by the caller."""
+    try:
+        return extract_file_mod_data(item_path, known_hash)
+    except Exception as e:
+        return None, str(e)
+
+
 def get_player_specific_ids(mod_data):
     song_ids = []  # Initialize an empty list to store song IDs
 
@@ -0,0 +1,74 @@
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ratings are ordered Easy, Normal, Hard, Extreme, ExExtreme. 0.0 means the song lacks that difficulty.
+DIFFICULTY_COUNT = 5
+# The packed bitfield stores Easy in the most significant 5 bits, ExExtreme in the least. See shift_difficulty().
+SLOT_SHIFTS = [5 * (DIFFICULTY_COUNT - 1 - slot) for slot in range(DIFFICULTY_COUNT)]
+LOCKED = 31.0
+PACKED_MASK = (1 << 5 * DIFFICULTY_COUNT) - 1
+
+if np is not None:
+    _NP_SHIFTS = np.array(SLOT_SHIFTS, dtype=np.int64)
+
+
+def shift_difficulty(current_diffs: int = 0, index: int = 0, level_float: float = 0.0) -> int:
+    """
+    Accumulates difficulties in a bitfield to save space in the export.
+    Easy MSB (index 4) <- ExEx LSB (index 0) due to Ex/ExEx prevalence.
+    Each diff is stored as 5 bits with MSB indicating the .5: 9.5 = 0b11001
+    Masks off missing DSCs with NOT 31. Locking handled in caller.
+    """
+
+    level_int = (int(level_float) | (not level_float.is_integer()) << 4) << 5 * index
+    current_diffs = current_diffs & ~level_int if level_float == LOCKED else current_diffs | level_int
+
+    return current_diffs
+
+
+def encode_difficulty(ratings: Sequence[float]) -> int:
+    """Pack 5 ratings (Easy first) into a bitfield, the inverse of decode_difficulty."""
+    packed = 0
+    for shift, rating in zip(SLOT_SHIFTS, ratings):
+        packed |= (int(rating) | (not float(rating).is_integer()) << 4) << shift
+    return packed
+
+
+def encode_difficulties(ratings: Sequence[Sequence[float]], lockouts: Optional[Sequence[Sequence[bool]]] = None) -> List[int]:
+    """
+    Pack rows of 5 ratings (Easy first) into bitfields, the inverse of decode_difficulties.
+    Difficulties flagged in lockouts (same shape) are left out, as if the song lacked them.
+    Uses NumPy when it is installed.
+    """
+    if np is not None:
+        values = np.asarray(ratings, dtype=np.float64).reshape(-1, DIFFICULTY_COUNT)
+        slots = values.astype(np.int64) | (values % 1 != 0).astype(np.int64) << 4
+        if lockouts is not None:
+            slots[np.asarray(lockouts, dtype=bool).reshape(-1, DIFFICULTY_COUNT)] = 0
+        return np.bitwise_or.reduce(slots << _NP_SHIFTS, axis=1).tolist()
+
+    if lockouts is not None:
+        ratings = [[0.0 if locked else rating for rating, locked in zip(row, locks)] for row, locks in zip(ratings, lockouts)]
+    return [encode_difficulty(row) for row in ratings]
+
+
+def decode_difficulty(packed: int) -> List[float]:
+    """Unpack a single bitfield into its 5 ratings, Easy first."""
+    return [(packed >> shift & 15) + (packed >> shift + 4 & 1) * 0.5 for shift in SLOT_SHIFTS]
+
+
+def decode_difficulties(packed: Sequence[int], as_list: bool = False):
+    """
+    Unpack bitfields into an (n, 5) array of ratings, Easy first.
+    Uses NumPy when it is installed, otherwise (or with as_list) a list of 5 float lists per song.
+    """
+    if np is not None:
+        slots = (np.asarray(packed, dtype=np.int64).reshape(-1, 1) >> _NP_SHIFTS) & 31
+        ratings = (slots & 15) + (slots >> 4 & 1) * 0.5
+        return ratings.tolist() if as_list else ratings
+
+    return [decode_difficulty(value) for value in packed]
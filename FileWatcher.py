@@ -0,0 +1,134 @@
+import asyncio
+import ctypes
+import ctypes.util
+import inspect
+import logging
+import os
+import struct
+import sys
+from typing import Awaitable, Callable, Dict, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str], Union[Awaitable[None], None]]
+
+# inotify(7)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class FileWatcher:
+    """
+    Calls a handler with the path of a file in a folder each time that file is written.
+
+    Uses inotify on Linux, through ctypes, so changes are seen right away.
+    Elsewhere, or when the folder can't be watched, polls the files' mtimes,
+    polling quicker after a change and slowing down to max_interval while nothing happens.
+    """
+
+    def __init__(self, folder: str, min_interval: float = 0.05, max_interval: float = 0.5) -> None:
+        self.folder = folder
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.handlers: Dict[str, Handler] = {}
+        self.mtimes: Dict[str, int] = {}
+        self._fd: Optional[int] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def watch(self, name: str, handler: Handler) -> None:
+        """Watch a file of the folder by name. Writes before this call are not reported."""
+        self.handlers[name] = handler
+        self.mtimes[name] = self._mtime(name)
+
+    def start(self) -> None:
+        if self._fd is None and self._poll_task is None and not self._start_inotify():
+            self._poll_task = asyncio.create_task(self._poll())
+
+    def stop(self) -> None:
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    def _start_inotify(self) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            if libc.inotify_add_watch(fd, os.fsencode(self.folder), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ATTRIB) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, f"inotify_add_watch failed for {self.folder}")
+        except (OSError, AttributeError) as e:
+            logger.debug(f"Polling {self.folder} instead of inotify: {e}")
+            return False
+
+        self._fd = fd
+        asyncio.get_running_loop().add_reader(fd, self._read_events)
+        logger.debug(f"Watching {self.folder} with inotify")
+        return True
+
+    def _read_events(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            names.add(data[offset:offset + length].rstrip(b"\0").decode(errors="replace"))
+            offset += length
+
+            if mask & IN_IGNORED:
+                # Folder removed or unmounted, keep going by polling.
+                self.stop()
+                self._poll_task = asyncio.create_task(self._poll())
+                return
+
+        for name in names:
+            if name in self.handlers:
+                self._check(name)
+
+    async def _poll(self) -> None:
+        interval = self.min_interval
+        while True:
+            await asyncio.sleep(interval)
+            changed = [name for name in list(self.handlers) if self._check(name)]
+            interval = self.min_interval if changed else min(self.max_interval, interval * 1.5)
+
+    def _check(self, name: str) -> bool:
+        """Dispatch if the file's mtime moved on, as one write may raise several events."""
+        mtime = self._mtime(name)
+        if not mtime or mtime <= self.mtimes.get(name, 0):
+            return False
+
+        self.mtimes[name] = mtime
+        result = self.handlers[name](os.path.join(self.folder, name))
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return True
+
+    def _mtime(self, name: str) -> int:
+        try:
+            return os.stat(os.path.join(self.folder, name)).st_mtime_ns
+        except OSError:
+            return 0
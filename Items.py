@@ -1,6 +1,10 @@
-from typing import NamedTuple, Optional, List
+from array import array
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterable, Iterator, NamedTuple, Optional, List, Sequence, Union
 from BaseClasses import Item, ItemClassification
 
+from .DifficultyCodec import PACKED_MASK, decode_difficulty, encode_difficulty
+
 
 class SongData(NamedTuple):
     """Special data container to contain the metadata of each song to make filtering work."""
@@ -13,11 +17,92 @@ class SongData(NamedTuple):
     difficulties: List[float]
 
 
+class SongCatalog(Mapping):
+    """
+    Song metadata stored by column, one row per song name in insertion order.
+    Looking up a name returns a SongData built from its row, so it reads like the dict of SongData it replaced.
+    """
+
+    DLC = 1
+    MODDED = 2
+
+    def __init__(self, rows: Iterable[tuple] = ()) -> None:
+        """rows: (name, item code, song ID, singers, DLC, difficulties) as in MegaMixSongData, all base game."""
+        self.names: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.codes = array("q")
+        self.song_ids = array("q")
+        self.flags = bytearray()
+        self.difficulties = array("q")  # Packed, see DifficultyCodec
+        self.singer_masks = array("q")
+        self.singers: List[str] = []  # Singer of each mask bit
+        self._singer_sets: Dict[int, FrozenSet[str]] = {}
+
+        for name, code, song_id, singers, dlc, difficulties in rows:
+            self.add(name, code, song_id, singers, dlc, False, difficulties)
+
+    def add(self, name: str, code: int, song_id: int, singers: Iterable[str], dlc: bool, modded: bool,
+            difficulties: Union[int, Sequence[float]]) -> int:
+        """Add or replace a song. Difficulties are 5 ratings or already packed. Returns its row."""
+        mask = 0
+        for singer in singers:
+            mask |= self.singer_bit(singer)
+
+        if not isinstance(difficulties, int):
+            difficulties = encode_difficulty(difficulties)
+
+        values = (code, song_id, dlc * self.DLC | modded * self.MODDED, difficulties & PACKED_MASK, mask)
+        columns = (self.codes, self.song_ids, self.flags, self.difficulties, self.singer_masks)
+
+        row = self.rows.get(name)
+        if row is None:
+            row = len(self.names)
+            self.rows[name] = row
+            self.names.append(name)
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[row] = value
+
+        return row
+
+    def singer_bit(self, singer: str) -> int:
+        if singer not in self.singers:
+            self.singers.append(singer)
+        return 1 << self.singers.index(singer)
+
+    def singer_set(self, mask: int) -> FrozenSet[str]:
+        singers = self._singer_sets.get(mask)
+        if singers is None:
+            singers = frozenset(singer for bit, singer in enumerate(self.singers) if mask >> bit & 1)
+            self._singer_sets[mask] = singers
+        return singers
+
+    def row_data(self, row: int) -> SongData:
+        flags = self.flags[row]
+        return SongData(self.codes[row], self.song_ids[row], self.singer_set(self.singer_masks[row]),
+                        bool(flags & self.DLC), bool(flags & self.MODDED), decode_difficulty(self.difficulties[row]))
+
+    def __getitem__(self, name: str) -> SongData:
+        return self.row_data(self.rows[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 class MegaMixSongItem(Item):
     game: str = "Hatsune Miku Project Diva Mega Mix+"
 
-    def __init__(self, name: str, player: int, data: SongData) -> None:
-        super().__init__(name, ItemClassification.progression, data.code, player)
+    def __init__(self, name: str, player: int, data: SongData,
+                 classification: ItemClassification = ItemClassification.progression) -> None:
+        super().__init__(name, classification, data.code, player)
 
 
 class MegaMixFixedItem(Item):
@@ -1,12 +1,15 @@
 # Local
-from .Items import SongData
+from .Items import SongCatalog
 from .SymbolFixer import fix_song_name
 from .MegaMixSongData import SONG_DATA
-from .DataHandler import extract_mod_data_to_json
+from .DataHandler import extract_mod_data_to_json, mod_data_wanted
+from .DifficultyCodec import SLOT_SHIFTS, decode_difficulties
+from .Profiling import timed
 
 # Python
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from collections import ChainMap
+from math import ceil, floor
 
 
 class MegaMixCollections:
@@ -15,8 +18,26 @@ class MegaMixCollections:
     LEEK_NAME: str = "Leek"
     LEEK_CODE: int = 1
 
-    song_items: Dict[str, SongData] = {}
+    song_items: SongCatalog
     song_locations: Dict[str, int] = {}
+    # Song name -> both of its (location name, location ID)
+    song_location_pairs: Dict[str, Tuple[Tuple[str, int], Tuple[str, int]]] = {}
+
+    # Ratings are whole or half stars up to 15.5, bucketed as rating * 2.
+    RATING_BUCKETS: int = 32
+    rating_index: Optional[List[List[List[int]]]] = None
+
+    SINGER_GROUPS: Dict[str, str] = {
+        "Hatsune Miku": "MikuSongs",
+        "Kagamine Rin": "RinSongs",
+        "Kagamine Len": "LenSongs",
+        "Megurine Luka": "LukaSongs",
+        "KAITO": "KAITOSongs",
+        "MEIKO": "MEIKOSongs",
+    }
+    # Songs with a chart for each difficulty, Easy first
+    DIFFICULTY_GROUPS: List[str] = ["EasySongs", "NormalSongs", "HardSongs", "ExtremeSongs", "ExExtremeSongs"]
+    item_name_groups: Optional[Dict[str, set]] = None
     
     filler_item_names: Dict[str, int] = {
         "SAFE": 2,
@@ -33,94 +54,157 @@ class MegaMixCollections:
         "Icon Trap": 9,
     }
 
-    def __init__(self) -> None:
-        self.item_names_to_id = ChainMap({self.LEEK_NAME: self.LEEK_CODE}, self.filler_item_names, self.song_items,
-                                         self.trap_items)
+    @timed()
+    def __init__(self, mod_data: Optional[List[dict]] = None) -> None:
+        """
+        mod_data
+          Parsed megamix_mod_data to add as modded songs. By default extracted from the Players folder,
+          but only when generating (see mod_data_wanted) so the Launcher and Client do not scan player YAMLs.
+        """
+        self.item_names_to_id = ChainMap({self.LEEK_NAME: self.LEEK_CODE}, self.filler_item_names, self.trap_items)
         self.location_names_to_id = ChainMap(self.song_locations)
+        self.pack_songs: Dict[str, List[str]] = {}
 
         self.song_items = SONG_DATA
-        mod_data = extract_mod_data_to_json()
-        base_game_ids = {song_data.songID for song_data in SONG_DATA.values() if song_data.songID is not None}
-
-        if mod_data:
-            for data_dict in mod_data:
-                for _, songs in data_dict.items():
-                    for song in songs:
-                        song_id = song[1]
-                        song_name = f"{fix_song_name(song[0])} [{song_id}]"
-                        item_id = (song_id * 10)
-                        # If cover song
-                        if song_id in base_game_ids:
-                            item_id += 1
-
-                        # Shift difficulty bitfields from modded data into [#,#,#,#,#]
-                        diff_info = []
-                        while len(diff_info) < 5:
-                            diff = song[2] & 15
-                            half = bool(song[2] >> 4 & 1)
-                            # there might be a perf difference over time between this VS reversing after it's full, deque, etc
-                            diff_info.insert(0, diff + (.5 if half else 0.0))
-                            song[2] >>= 5
-
-                        self.song_items[song_name] = SongData(item_id, song_id, [], False, True, diff_info)
-
-        self.item_names_to_id.update({name: data.code for name, data in self.song_items.items()})
-
-        for song_name, song_data in self.song_items.items():
-            if song_data.code % 2 != 0:  # Fix code for covers
-                for i in range(2):
-                    self.song_locations[f"{song_name}-{i}"] = (song_data.code + i - 1)
-                continue
-
-            for i in range(2):
-                self.song_locations[f"{song_name}-{i}"] = (song_data.code + i)
-
+        self.base_game_ids = {song_id for song_id, flags in zip(SONG_DATA.song_ids, SONG_DATA.flags)
+                              if not flags & SongCatalog.MODDED}
+        self.register_songs(list(self.song_items))
+
+        if mod_data is None:
+            mod_data = extract_mod_data_to_json() if mod_data_wanted() else []
+        self.add_mod_data(mod_data)
+
+    def add_mod_data(self, mod_data: List[dict]) -> None:
+        """Add the songs of each {pack: [[name, song ID, difficulties], ...]} as modded songs."""
+        added = []
+
+        for data_dict in mod_data:
+            for pack, songs in data_dict.items():
+                pack_songs = self.pack_songs.setdefault(pack, [])
+                for song in songs:
+                    song_id = song[1]
+                    song_name = f"{fix_song_name(song[0])} [{song_id}]"
+                    item_id = (song_id * 10)
+                    # If cover song
+                    if song_id in self.base_game_ids:
+                        item_id += 1
+
+                    # Difficulty bitfields from modded data are kept packed
+                    self.song_items.add(song_name, item_id, song_id, (), False, True, song[2])
+                    added.append(song_name)
+                    pack_songs.append(song_name)
+
+        self.register_songs(added)
+        self.rating_index = None
+        self.item_name_groups = None
+
+    def register_songs(self, song_names: List[str]) -> None:
+        """Add item and location IDs for songs in song_items."""
+        catalog = self.song_items
+        for song_name in song_names:
+            code = catalog.codes[catalog.rows[song_name]]
+            self.item_names_to_id[song_name] = code
+
+            if code % 2 != 0:  # Fix code for covers
+                code -= 1
+
+            pair = ((f"{song_name}-0", code), (f"{song_name}-1", code + 1))
+            self.song_location_pairs[song_name] = pair
+            self.song_locations.update(pair)
+
+
+    def build_rating_index(self) -> None:
+        """Bucket every song by difficulty slot and rating, in 0.5 steps, for get_songs_with_settings."""
+        self.rating_index = [[[] for _ in range(self.RATING_BUCKETS)] for _ in range(5)]
+
+        for row, difficulties in enumerate(decode_difficulties(self.song_items.difficulties, as_list=True)):
+            for diff, rating in enumerate(difficulties):
+                if rating > 0.0: # Has that difficulty
+                    self.rating_index[diff][int(rating * 2)].append(row)
+
+    def rating_buckets(self, diff: int, diff_lower: float, diff_higher: float) -> List[List[int]]:
+        """Buckets of a difficulty slot covering the inclusive rating range."""
+        if self.rating_index is None:
+            self.build_rating_index()
+
+        lower_bucket = max(1, ceil(diff_lower * 2))
+        higher_bucket = min(self.RATING_BUCKETS - 1, floor(diff_higher * 2))
+        return self.rating_index[diff][lower_bucket:higher_bucket + 1]
+
+    def count_songs_upper_bound(self, allowed_diff: List[int], diff_lower: float, diff_higher: float) -> int:
+        """At least as many as get_songs_with_settings would return, from the bucket sizes alone."""
+        return sum(len(bucket) for diff in allowed_diff for bucket in self.rating_buckets(diff, diff_lower, diff_higher))
 
     def get_songs_with_settings(self, dlc: bool, mod_ids: List[int], allowed_diff: List[int], diff_lower: float, diff_higher: float) -> List[str]:
         """Gets a list of all songs that match the filter settings. Difficulty thresholds are inclusive."""
-        filtered_list = []
+        rows = set()
+        for diff in allowed_diff:
+            for bucket in self.rating_buckets(diff, diff_lower, diff_higher):
+                rows.update(bucket)
 
-        for songKey, songData in self.song_items.items():
+        mod_ids = set(mod_ids)
+        filtered_list = []
+        catalog = self.song_items
 
-            song_id = songData.songID
+        # Sorted rows keep song_items order
+        for row in sorted(rows):
+            song_id = catalog.song_ids[row]
+            is_dlc = catalog.flags[row] & SongCatalog.DLC
+            modded = catalog.flags[row] & SongCatalog.MODDED
 
             # If song is DLC and DLC is disabled, skip song
-            if songData.DLC and not dlc:
+            if is_dlc and not dlc:
                 continue
 
             # Skip modded song if not intended for this player
-            if songData.modded and song_id not in mod_ids:
+            if modded and song_id not in mod_ids:
                 continue
 
             # Do not give base game version if modded cover available for this player
-            if not songData.modded and song_id in mod_ids:
+            if not modded and song_id in mod_ids:
                 continue
 
-            for diff in allowed_diff:
-                if songData.difficulties[diff] > 0.0: # Has that difficulty
-                    if diff_lower <= songData.difficulties[diff] <= diff_higher:
-                        filtered_list.append(songKey)
-                        break
+            filtered_list.append(catalog.names[row])
 
         return filtered_list
 
-    def get_item_name_groups(self) -> dict[str, set]:
-        base_songs = {name: data for name, data in self.song_items.items() if not data.modded}
-        groups = {
-            "BaseSongs": {name for name, data in base_songs.items() if not data.DLC},
-            "DLCSongs": {name for name, data in base_songs.items() if data.DLC},
-
-            "MikuSongs": {name for name, data in base_songs.items() if "Hatsune Miku" in data.singers},
-            "RinSongs": {name for name, data in base_songs.items() if "Kagamine Rin" in data.singers},
-            "LenSongs": {name for name, data in base_songs.items() if "Kagamine Len" in data.singers},
-            "LukaSongs": {name for name, data in base_songs.items() if "Megurine Luka" in data.singers},
-            "KAITOSongs": {name for name, data in base_songs.items() if "KAITO" in data.singers},
-            "MEIKOSongs": {name for name, data in base_songs.items() if "MEIKO" in data.singers},
-        }
-
-        # Experimental since all players share this group. Filtered in handle_plando.
-        modded = {name for name, data in self.song_items.items() if data.modded}
+    def get_item_name_groups(self) -> Dict[str, set]:
+        """Built on first use and kept until more songs are added."""
+        if self.item_name_groups is None:
+            self.item_name_groups = self.build_item_name_groups()
+        return self.item_name_groups
+
+    def build_item_name_groups(self) -> Dict[str, set]:
+        """Sort every song into its groups in a single pass over the catalog's flag, singer and difficulty columns."""
+        catalog = self.song_items
+        singer_groups = {catalog.singer_bit(singer): group for singer, group in self.SINGER_GROUPS.items()}
+        difficulty_groups = list(zip(SLOT_SHIFTS, self.DIFFICULTY_GROUPS))
+
+        groups = {group: set() for group in ["BaseSongs", "DLCSongs", *singer_groups.values(), *self.DIFFICULTY_GROUPS]}
+        modded = set()
+
+        for name, flags, singers, difficulties in zip(catalog.names, catalog.flags, catalog.singer_masks, catalog.difficulties):
+            if flags & SongCatalog.MODDED:
+                modded.add(name)
+                continue
+
+            groups["DLCSongs" if flags & SongCatalog.DLC else "BaseSongs"].add(name)
+
+            while singers:
+                bit = singers & -singers
+                singers ^= bit
+                if bit in singer_groups:
+                    groups[singer_groups[bit]].add(name)
+
+            for shift, group in difficulty_groups:
+                if difficulties >> shift & 31:
+                    groups[group].add(name)
+
+        # Experimental since all players share these groups. Filtered in handle_plando.
         if modded: # test_groups::TestNameGroups::test_item_name_groups_not_empty
-            groups.update({"ModdedSongs": modded})
+            groups["ModdedSongs"] = modded
+            for pack, songs in self.pack_songs.items():
+                if songs:
+                    groups[f"{pack} Songs"] = set(songs)
 
         return groups
@@ -0,0 +1,403 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from .Profiling import timed
+
+logger = logging.getLogger(__name__)
+
+# Only the chart length lines are toggled. A song without any enabled length line is hidden in-game.
+LENGTH_LINE = re.compile(r"(?:#ARCH#)?pv_(\d+)\.difficulty\.(?:easy|normal|hard|extreme).length=\d")
+DISABLED_PREFIX = "#ARCH#"
+
+# Always available songs (the AP mod's own song and 700). Never disabled.
+PROTECTED_IDS = frozenset({"144", "700"})
+
+
+def pv_key(song_id: int) -> str:
+    """Format a song ID the way it appears in a pv_db, i.e. zero-padded to 3 digits."""
+    return str(song_id).zfill(3)
+
+
+class ModPVDB:
+    """
+    Parsed mod_pv_db.txt, indexing every toggleable difficulty length line by its song ID.
+
+    Enabling or disabling only touches the indexed lines, everything else is kept verbatim.
+    Line endings are handled by the caller opening the file in text mode, same as the previous regex functions.
+    """
+
+    def __init__(self, pv_db: str) -> None:
+        self.lines = pv_db.split("\n")
+        self.index: dict[str, list[int]] = {}
+        self.original: dict[int, bool] = {}  # line -> enabled state before the first change
+
+        for i, line in enumerate(self.lines):
+            match = LENGTH_LINE.fullmatch(line)
+            if match:
+                self.index.setdefault(match.group(1), []).append(i)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ModPVDB":
+        with open(file_path, "r", encoding="utf-8") as file:
+            return cls(file.read())
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def dirty(self) -> bool:
+        return any(self.is_enabled(i) != enabled for i, enabled in self.original.items())
+
+    def original_text(self) -> str:
+        """The text as loaded, before any change."""
+        lines = list(self.lines)
+        for i, enabled in self.original.items():
+            line = lines[i].removeprefix(DISABLED_PREFIX)
+            lines[i] = line if enabled else f"{DISABLED_PREFIX}{line}"
+        return "\n".join(lines)
+
+    def line_key(self, line: int) -> Optional[str]:
+        if line >= len(self.lines):
+            return None
+        match = LENGTH_LINE.fullmatch(self.lines[line])
+        return match.group(1) if match else None
+
+    def is_enabled(self, line: int) -> bool:
+        return not self.lines[line].startswith(DISABLED_PREFIX)
+
+    def enabled_ids(self) -> set[str]:
+        """IDs with at least one enabled length line."""
+        return {song_id for song_id, lines in self.index.items() if any(self.is_enabled(i) for i in lines)}
+
+    def set_enabled(self, song_ids: Optional[Iterable[str]], enabled: bool, invert: bool = False) -> None:
+        """
+        Enable or disable the length lines of the given padded song IDs.
+
+        song_ids
+          Padded IDs (see pv_key). None targets every song.
+        invert
+          Target every song except the given IDs.
+        """
+        if song_ids is None:
+            targets = self.index.keys()
+        else:
+            song_ids = song_ids if isinstance(song_ids, (set, frozenset)) else set(song_ids)
+            if invert:
+                targets = [song_id for song_id in self.index if song_id not in song_ids]
+            else:
+                targets = [song_id for song_id in song_ids if song_id in self.index]
+
+        for song_id in targets:
+            if not enabled and song_id in PROTECTED_IDS:
+                continue
+            for i in self.index[song_id]:
+                self.set_line(i, enabled)
+
+    def enable(self, song_ids: Optional[Iterable[str]], invert: bool = False) -> None:
+        self.set_enabled(song_ids, True, invert)
+
+    def disable(self, song_ids: Optional[Iterable[str]], invert: bool = False) -> None:
+        self.set_enabled(song_ids, False, invert)
+
+    def set_line(self, i: int, enabled: bool) -> None:
+        line = self.lines[i]
+        was_enabled = not line.startswith(DISABLED_PREFIX)
+        if was_enabled == enabled:
+            return
+
+        self.original.setdefault(i, was_enabled)
+        self.lines[i] = line.removeprefix(DISABLED_PREFIX) if enabled else f"{DISABLED_PREFIX}{line}"
+
+    def save(self, file_path: str, journal: bool = True) -> bool:
+        """
+        Write the file back if anything changed. Returns whether it was written.
+        Toggled lines are journaled before writing, see PVDBJournal.
+        Written to a temporary file first and swapped in, so the game never reads a partial file.
+        """
+        if not self.dirty:
+            return False
+
+        if journal:
+            PVDBJournal.for_file(file_path, self).record(self)
+
+        write_atomic(file_path, self.text)
+
+        return True
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def write_atomic(file_path: str, text: str) -> None:
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_path, file_path)
+
+
+class PVDBJournal:
+    """
+    Original state of every line the client toggled in a pv_db, and a hash of the file before the first change.
+    Kept next to the pv_db (mod_pv_dbJOURNAL.json) until restored, replacing full copies of the file.
+    Cached in memory while the journal file keeps the mtime it was saved or loaded with,
+    so journals restored or removed by another process are started over.
+    """
+
+    cache: dict[str, "PVDBJournal"] = {}
+
+    def __init__(self, file_path: str, original_hash: str, lines: Optional[dict[int, tuple[str, bool]]] = None) -> None:
+        self.file_path = file_path
+        self.original_hash = original_hash
+        self.lines: dict[int, tuple[str, bool]] = lines or {}  # line -> (song ID, enabled)
+        self.mtime = 0  # Of the journal file, 0 until saved
+
+    @staticmethod
+    def journal_path(file_path: str) -> str:
+        name, _ = os.path.splitext(file_path)
+        return f"{name}JOURNAL.json"
+
+    @staticmethod
+    def cache_key(file_path: str) -> str:
+        return os.path.normcase(os.path.normpath(file_path))
+
+    @staticmethod
+    def journal_mtime(file_path: str) -> int:
+        try:
+            return os.stat(PVDBJournal.journal_path(file_path)).st_mtime_ns
+        except OSError:
+            return 0
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional["PVDBJournal"]:
+        key = cls.cache_key(file_path)
+        mtime = cls.journal_mtime(file_path)
+        cached = cls.cache.pop(key, None)
+        if cached and mtime and cached.mtime == mtime:
+            cls.cache[key] = cached
+            return cached
+
+        try:
+            with open(cls.journal_path(file_path), "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        journal = cls(file_path, data["hash"], {line: (song_id, bool(enabled)) for line, song_id, enabled in data["lines"]})
+        journal.mtime = mtime
+        cls.cache[key] = journal
+        return journal
+
+    @classmethod
+    def for_file(cls, file_path: str, pv_db: ModPVDB) -> "PVDBJournal":
+        """Existing journal of the file, or a new one snapshotting the pv_db as it was loaded."""
+        journal = cls.load(file_path)
+        if not journal:
+            journal = cls(file_path, content_hash(pv_db.original_text()))
+            cls.cache[cls.cache_key(file_path)] = journal
+        return journal
+
+    def record(self, pv_db: ModPVDB) -> None:
+        """Keep the original state of lines changed for the first time. Written before the pv_db itself."""
+        new_lines = {line: (pv_db.line_key(line), enabled) for line, enabled in pv_db.original.items()
+                     if line not in self.lines}
+        if new_lines:
+            self.lines.update(new_lines)
+            self.save()
+
+    def save(self) -> None:
+        lines = [[line, song_id, int(enabled)] for line, (song_id, enabled) in sorted(self.lines.items())]
+        write_atomic(self.journal_path(self.file_path), json.dumps({"hash": self.original_hash, "lines": lines},
+                                                                   separators=(",", ":")))
+        self.mtime = self.journal_mtime(self.file_path)
+
+    def restore(self) -> bool:
+        """Revert the journaled lines unless the file already matches its snapshot, then drop the journal."""
+        restored = False
+
+        if self.lines:
+            pv_db = ModPVDB.load(self.file_path)
+            if content_hash(pv_db.text) != self.original_hash:
+                for line, (song_id, enabled) in self.lines.items():
+                    if pv_db.line_key(line) == song_id:
+                        pv_db.set_line(line, enabled)
+                restored = pv_db.save(self.file_path, journal=False)
+
+        os.remove(self.journal_path(self.file_path))
+        self.cache.pop(self.cache_key(self.file_path), None)
+        return restored
+
+
+class PVDBState(NamedTuple):
+    """Songs of a pv_db as last read or written by the client, valid while the file's mtime and size match."""
+    mtime: int
+    size: int
+    enabled: frozenset[str]
+    disabled: frozenset[str]
+
+    @classmethod
+    def of(cls, file_path: str, pv_db: ModPVDB) -> Optional["PVDBState"]:
+        """State of a pv_db just read or written. None if a song is only partly enabled."""
+        enabled = set()
+        disabled = set()
+        for song_id, lines in pv_db.index.items():
+            states = {pv_db.is_enabled(i) for i in lines}
+            if len(states) > 1:
+                return None
+            (enabled if states.pop() else disabled).add(song_id)
+
+        stat = os.stat(file_path)
+        return cls(stat.st_mtime_ns, stat.st_size, frozenset(enabled), frozenset(disabled))
+
+    def is_current(self, file_path: str) -> bool:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.mtime and stat.st_size == self.size
+
+    def to_json(self) -> dict:
+        return {"mtime": self.mtime, "size": self.size, "enabled": sorted(self.enabled), "disabled": sorted(self.disabled)}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "PVDBState":
+        return cls(data["mtime"], data["size"], frozenset(data["enabled"]), frozenset(data["disabled"]))
+
+
+class PendingPVDB:
+    """Desired state of a single pv_db: an optional state for every song, then per song overrides."""
+
+    def __init__(self) -> None:
+        self.base: Optional[bool] = None
+        self.songs: dict[str, bool] = {}
+
+    def apply(self, pv_db: ModPVDB) -> None:
+        if self.base is not None:
+            pv_db.set_enabled(self.songs.keys(), self.base, invert=True)
+
+        pv_db.enable({song_id for song_id, enabled in self.songs.items() if enabled})
+        pv_db.disable({song_id for song_id, enabled in self.songs.items() if not enabled})
+
+    def enabled_after(self, state: PVDBState, always_disabled: Iterable[str] = ()) -> set[str]:
+        """The enabled songs apply() and then disabling always_disabled would leave, without reading the file."""
+        song_ids = state.enabled | state.disabled
+        enabled = set(state.enabled)
+
+        if self.base is not None:
+            targets = song_ids - self.songs.keys()
+            if self.base:
+                enabled |= targets
+            else:
+                enabled -= targets - PROTECTED_IDS
+
+        for song_id, song_enabled in self.songs.items():
+            if song_id not in song_ids:
+                continue
+            if song_enabled:
+                enabled.add(song_id)
+            elif song_id not in PROTECTED_IDS:
+                enabled.discard(song_id)
+
+        enabled -= set(always_disabled) - PROTECTED_IDS
+        return enabled
+
+
+class PVDBWriter:
+    """
+    Write-behind for pv_db changes. Changes are collected per file and flushed once per interval,
+    so the number of writes does not depend on how many items arrive at once.
+    Flushes run on a single worker thread, off the event loop and in order with run().
+
+    always_disabled
+      Padded IDs to disable on every flush, i.e. DLC songs when the DLC is not installed.
+
+    The state of every file written is kept in applied. Files still in that state are not read again
+    when the queued changes would leave them as they are.
+    """
+
+    def __init__(self, always_disabled: Iterable[str] = (), interval: float = 0.1) -> None:
+        self.always_disabled = frozenset(always_disabled)
+        self.interval = interval
+        self.pending: dict[str, PendingPVDB] = {}
+        self.applied: dict[str, PVDBState] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pv_db")
+
+    def set_state(self, file_path: str, enabled: bool, exceptions: Iterable[str] = ()) -> None:
+        """Enable or disable every song but the given padded IDs, which get the opposite. Replaces any queued change."""
+        pending = self.pending.setdefault(file_path, PendingPVDB())
+        pending.base = enabled
+        pending.songs = dict.fromkeys(exceptions, not enabled)
+        self.schedule()
+
+    def schedule(self) -> None:
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(self.interval, self.flush_in_background)
+
+    def discard(self) -> None:
+        """Drop queued changes and known states, i.e. when restoring the original files."""
+        self.pending.clear()
+        self.applied.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def take_pending(self) -> dict[str, PendingPVDB]:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        pending, self.pending = self.pending, {}
+        return pending
+
+    def flush_in_background(self) -> None:
+        pending = self.take_pending()
+        if pending:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, self.write, pending)
+            future.add_done_callback(self.log_failure)
+
+    @staticmethod
+    def log_failure(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception():
+            logger.error("Failed to update pv_dbs", exc_info=future.exception())
+
+    def flush(self) -> int:
+        """Apply every queued change now. Returns the number of files written."""
+        return self.write(self.take_pending())
+
+    async def run(self, function: Callable, *args):
+        """Run file work on the writer's thread, after the flushes already started."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    @timed()
+    def write(self, pending: dict[str, PendingPVDB]) -> int:
+        """At most one read and one write per file, neither for files already in the wanted state."""
+        written = 0
+
+        for file_path, changes in pending.items():
+            state = self.applied.get(file_path)
+            if state and state.is_current(file_path) and changes.enabled_after(state, self.always_disabled) == state.enabled:
+                continue
+
+            try:
+                pv_db = ModPVDB.load(file_path)
+                changes.apply(pv_db)
+                pv_db.disable(self.always_disabled)
+                written += pv_db.save(file_path)
+
+                state = PVDBState.of(file_path, pv_db)
+                if state:
+                    self.applied[file_path] = state
+                else:
+                    self.applied.pop(file_path, None)
+            except (OSError, ValueError) as e:  # ValueError covers undecodable files
+                logger.warning(f"Failed to update {file_path}: {e}")
+
+        return written
@@ -0,0 +1,162 @@
+import functools
+import json
+import logging
+import os
+from typing import Iterable, Optional
+
+import Utils
+
+from .DataHandler import game_paths
+
+logger = logging.getLogger(__name__)
+
+PV_DB_NAME = "mod_pv_db.txt"
+CACHE_VERSION = 2
+
+
+def normalize_pack(pack: str) -> str:
+    """Pack names are relative paths from the mods folder, possibly generated on another OS."""
+    return os.path.normpath(pack.replace("\\", "/"))
+
+
+class ModsIndex:
+    """
+    Index of every mod in the mods folder that has a rom/mod_pv_db.txt.
+
+    Every folder is scanned except rom folders, which hold a mod's assets. Packs can sit below other mods,
+    i.e. subfolders pulled in by a config.toml include, so mod folders are descended into as well.
+    Folder mtimes are kept with the result so later runs only rescan folders that changed.
+    """
+
+    def __init__(self, mods_path: str, cache_file: Optional[str] = None) -> None:
+        self.mods_path = mods_path
+        self.cache_file = cache_file
+        self.dirs: dict[str, int] = {}  # relative folder -> mtime, for every folder scanned including mods
+        self.roms: dict[str, int] = {}  # relative mod folder -> mtime of its rom folder
+        self.packs: set[str] = set()  # relative mod folders with a mod_pv_db.txt
+
+    def pv_db_path(self, pack: str) -> str:
+        return os.path.join(self.mods_path, pack, "rom", PV_DB_NAME)
+
+    def pv_db_paths(self, packs: Optional[Iterable[str]] = None) -> list[str]:
+        """Paths to the mod_pv_db.txt of the given packs, or all packs. Packs not found are skipped."""
+        if packs is None:
+            return [self.pv_db_path(pack) for pack in sorted(self.packs)]
+
+        return list(self.pack_pv_db_paths(packs).values())
+
+    def pack_pv_db_paths(self, packs: Iterable[str]) -> dict[str, str]:
+        """The given pack names, as written, to their mod_pv_db.txt. Packs not found are left out with a warning."""
+        paths = {}
+        for pack in packs:
+            normalized = normalize_pack(pack)
+            if normalized in self.packs:
+                paths[pack] = self.pv_db_path(normalized)
+            else:
+                logger.warning(f"Song pack {normalized} not found in {self.mods_path}")
+        return paths
+
+    def refresh(self) -> "ModsIndex":
+        """Revalidate against the mods folder, rescanning only folders whose mtime changed."""
+        if not self.dirs:
+            self.load()
+
+        if not self.dirs:
+            changed = [""]
+        else:
+            changed = [rel for rel, mtime in self.dirs.items() if self._mtime(rel) != mtime]
+            changed += [rel for rel, mtime in self.roms.items() if self._mtime(os.path.join(rel, "rom")) != mtime]
+
+        # Rescanning a folder covers everything below it.
+        rescanned = []
+        for rel in sorted(set(changed), key=len):
+            if not any(self._is_within(rel, parent) for parent in rescanned):
+                self.rescan(rel)
+                rescanned.append(rel)
+
+        if changed:
+            logger.debug(f"Rescanned {len(changed)} folder(s) in {self.mods_path}, {len(self.packs)} packs")
+            self.save()
+
+        return self
+
+    def rescan(self, rel: str) -> None:
+        for records in (self.dirs, self.roms):
+            for key in [key for key in records if self._is_within(key, rel)]:
+                del records[key]
+        self.packs = {pack for pack in self.packs if not self._is_within(pack, rel)}
+
+        self._scan(rel)
+
+    def _scan(self, rel: str) -> None:
+        path = os.path.join(self.mods_path, rel)
+        try:
+            self.dirs[rel] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            self.dirs.pop(rel, None)
+            return
+
+        if rel and "rom" in entries:
+            rom = os.path.join(rel, "rom")
+            self.roms[rel] = self._mtime(rom)
+            if os.path.isfile(os.path.join(self.mods_path, rom, PV_DB_NAME)):
+                self.packs.add(rel)
+
+        for name, entry in entries.items():
+            if name != "rom" and entry.is_dir(follow_symlinks=False):
+                self._scan(os.path.join(rel, name))
+
+    def _mtime(self, rel: str) -> int:
+        try:
+            return os.stat(os.path.join(self.mods_path, rel)).st_mtime_ns
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _is_within(key: str, rel: str) -> bool:
+        return not rel or key == rel or key.startswith(rel + os.sep)
+
+    def load(self) -> None:
+        if not self.cache_file or not os.path.isfile(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring mods index cache: {e}")
+            return
+
+        if data.get("version") != CACHE_VERSION or data.get("mods") != self.mods_path:
+            return
+
+        self.dirs = data["dirs"]
+        self.roms = data["roms"]
+        self.packs = set(data["packs"])
+
+    def save(self) -> None:
+        if not self.cache_file:
+            return
+
+        data = {
+            "version": CACHE_VERSION,
+            "mods": self.mods_path,
+            "dirs": self.dirs,
+            "roms": self.roms,
+            "packs": sorted(self.packs),
+        }
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+        except OSError as e:
+            logger.debug(f"Could not save mods index cache: {e}")
+
+
+@functools.cache
+def mods_index() -> ModsIndex:
+    """The mods index of the configured game, see game_paths(). Call refresh() before reading."""
+    return ModsIndex(game_paths().get("mods"), Utils.cache_path("megamix", "mods_index.json"))
@@ -0,0 +1,116 @@
+"""
+Opt-in timing of hot paths, switched on with the MEGAMIX_PROFILE environment variable.
+
+  MEGAMIX_PROFILE=1                     log each timed call, and totals per function at exit
+  MEGAMIX_PROFILE=cprofile,tracemalloc  also capture a cProfile and/or tracemalloc snapshot of the process
+  MEGAMIX_PROFILE_FILE=path             base path for the captures, megamix_profile in the logs folder by default
+
+When it is not set, timed() returns functions as they are.
+"""
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+FLAGS = {flag.strip().lower() for flag in os.environ.get("MEGAMIX_PROFILE", "").split(",")} - {"", "0", "false", "off"}
+ENABLED = bool(FLAGS)
+
+totals: Dict[str, List[float]] = {}  # name -> [calls, seconds]
+
+_profiler = None
+
+F = TypeVar("F", bound=Callable)
+
+
+def record(name: str, seconds: float) -> None:
+    entry = totals.setdefault(name, [0, 0.0])
+    entry[0] += 1
+    entry[1] += seconds
+    logger.debug(f"{name} took {seconds * 1000:.2f} ms")
+
+
+def timed(name: Optional[str] = None) -> Callable[[F], F]:
+    """Time every call of the decorated function or coroutine, as its qualified name unless given."""
+    def decorate(function: F) -> F:
+        if not ENABLED:
+            return function
+
+        label = name or function.__qualname__
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    record(label, time.perf_counter() - start)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+        return wrapper
+
+    return decorate
+
+
+def output_path() -> str:
+    base = os.environ.get("MEGAMIX_PROFILE_FILE")
+    if not base:
+        import Utils
+        base = Utils.user_path("logs", "megamix_profile")
+    return f"{base}_{os.getpid()}"
+
+
+def dump() -> None:
+    """Log the span totals and write the captures, run at exit."""
+    for name, (calls, seconds) in sorted(totals.items(), key=lambda entry: -entry[1][1]):
+        logger.info(f"{name}: {calls} call(s), {seconds:.3f} s")
+
+    if not FLAGS & {"cprofile", "tracemalloc"}:
+        return
+
+    path = output_path()
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(f"{path}.spans.json", "w", encoding="utf-8") as file:
+            json.dump(totals, file, indent=1)
+
+        if _profiler is not None:
+            _profiler.disable()
+            _profiler.dump_stats(f"{path}.prof")
+
+        if "tracemalloc" in FLAGS:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            with open(f"{path}.tracemalloc.txt", "w", encoding="utf-8") as file:
+                file.write(f"current {current} bytes, peak {peak} bytes\n")
+                for stat in tracemalloc.take_snapshot().statistics("lineno")[:50]:
+                    file.write(f"{stat}\n")
+    except OSError as e:
+        logger.warning(f"Could not write profile to {path}: {e}")
+        return
+
+    logger.info(f"Profile written to {path}.*")
+
+
+if ENABLED:
+    if "cprofile" in FLAGS:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    if "tracemalloc" in FLAGS:
+        import tracemalloc
+        tracemalloc.start()
+    atexit.register(dump)
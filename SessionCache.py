@@ -0,0 +1,77 @@
+import json
+import logging
+import os
+from typing import Optional
+
+import Utils
+
+from .ModPVDB import PVDBState
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class SessionCache:
+    """
+    What the client learnt while connected to a slot, kept per seed so reconnects and restarts skip GetDataPackage.
+
+    Only valid for the datapackage checksum the server announced in RoomInfo when it was saved.
+    Holds the location and item maps filtered to the slot, and the last known state of its pv_dbs.
+    """
+
+    def __init__(self, seed_name: str, slot: int, checksum: str, cache_file: Optional[str] = None) -> None:
+        self.seed_name = seed_name
+        self.slot = slot
+        self.checksum = checksum
+        self.cache_file = cache_file or self.default_path(seed_name, slot)
+        self.location_name_to_id: dict[str, int] = {}
+        self.item_name_to_id: dict[str, int] = {}
+        self.pv_dbs: dict[str, PVDBState] = {}
+
+    @staticmethod
+    def default_path(seed_name: str, slot: int) -> str:
+        name = "".join(char if char.isalnum() else "_" for char in seed_name)
+        return Utils.cache_path("megamix", "sessions", f"{name}_{slot}.json")
+
+    @classmethod
+    def load(cls, seed_name: str, slot: int, checksum: Optional[str],
+             cache_file: Optional[str] = None) -> Optional["SessionCache"]:
+        """The saved session, or None if there is none for this seed, slot and checksum."""
+        if not seed_name or not checksum:
+            return None
+
+        cache = cls(seed_name, slot, checksum, cache_file)
+        try:
+            with open(cache.cache_file, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring session cache: {e}")
+            return None
+
+        if data.get("version") != CACHE_VERSION or data.get("seed") != seed_name or data.get("checksum") != checksum:
+            return None
+
+        cache.location_name_to_id = data["locations"]
+        cache.item_name_to_id = data["items"]
+        cache.pv_dbs = {file_path: PVDBState.from_json(state) for file_path, state in data["pv_dbs"].items()}
+        return cache
+
+    def save(self) -> None:
+        data = {
+            "version": CACHE_VERSION,
+            "seed": self.seed_name,
+            "checksum": self.checksum,
+            "locations": self.location_name_to_id,
+            "items": self.item_name_to_id,
+            "pv_dbs": {file_path: state.to_json() for file_path, state in self.pv_dbs.items()},
+        }
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+        except OSError as e:
+            logger.debug(f"Could not save session cache: {e}")
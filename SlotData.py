@@ -0,0 +1,90 @@
+import base64
+from typing import Iterable, List, Union
+
+# 1: finalSongIDs and modData as plain ID lists (no version key)
+# 2: the same, encoded with encode_song_ids()
+SLOT_DATA_VERSION = 2
+
+RUNS_PREFIX = "r:"
+BITSET_PREFIX = "b:"
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def to_base36(number: int) -> str:
+    digits = ""
+    while True:
+        number, digit = divmod(number, 36)
+        digits = DIGITS[digit] + digits
+        if not number:
+            return digits
+
+
+def encode_song_ids(song_ids: Iterable[int]) -> str:
+    """
+    Encode song IDs as the shorter of two strings:
+      r:gap[.len],...  runs of consecutive IDs in base36, gap from the end of the previous run
+      b:offset:bits    base64 bitset of the IDs from the lowest (base36) one
+    """
+    song_ids = sorted(set(song_ids))
+    if not song_ids:
+        return RUNS_PREFIX
+
+    runs = []
+    previous = -1
+    start = song_ids[0]
+    for current, following in zip(song_ids, song_ids[1:] + [None]):
+        if following == current + 1:
+            continue
+        gap = to_base36(start - previous - 1)
+        runs.append(gap if current == start else f"{gap}.{to_base36(current - start)}")
+        previous = current
+        start = following
+
+    offset = song_ids[0]
+    bits = 0
+    for song_id in song_ids:
+        bits |= 1 << song_id - offset
+    bitset = base64.b64encode(bits.to_bytes((bits.bit_length() + 7) // 8, "little")).decode("ascii")
+
+    encoded_runs = RUNS_PREFIX + ",".join(runs)
+    encoded_bitset = f"{BITSET_PREFIX}{to_base36(offset)}:{bitset}"
+    return encoded_runs if len(encoded_runs) <= len(encoded_bitset) else encoded_bitset
+
+
+def decode_song_ids(encoded: Union[str, Iterable[int]]) -> List[int]:
+    """Sorted IDs from encode_song_ids(), or a plain list of IDs as sent before version 2."""
+    if not isinstance(encoded, str):
+        return sorted(set(encoded))
+
+    song_ids = []
+    if encoded.startswith(RUNS_PREFIX):
+        previous = -1
+        for run in filter(None, encoded[len(RUNS_PREFIX):].split(",")):
+            gap, _, length = run.partition(".")
+            start = previous + 1 + int(gap, 36)
+            previous = start + (int(length, 36) if length else 0)
+            song_ids.extend(range(start, previous + 1))
+    elif encoded.startswith(BITSET_PREFIX):
+        offset, _, bitset = encoded[len(BITSET_PREFIX):].partition(":")
+        offset = int(offset, 36)
+        bits = int.from_bytes(base64.b64decode(bitset), "little")
+        while bits:
+            low = bits & -bits
+            song_ids.append(offset + low.bit_length() - 1)
+            bits ^= low
+    else:
+        raise ValueError(f"Unknown song ID encoding: {encoded[:10]}")
+
+    return song_ids
+
+
+def decode_slot_data(slot_data: dict) -> dict:
+    """Slot data with finalSongIDs and modData as plain ID lists, whichever version sent it."""
+    slot_data = dict(slot_data)
+
+    if "finalSongIDs" in slot_data:
+        slot_data["finalSongIDs"] = decode_song_ids(slot_data["finalSongIDs"])
+    if slot_data.get("modData"):
+        slot_data["modData"] = {pack: decode_song_ids(ids) for pack, ids in slot_data["modData"].items()}
+
+    return slot_data
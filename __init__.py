@@ -11,6 +11,8 @@ from .Items import MegaMixSongItem, MegaMixFixedItem
 from .Locations import MegaMixLocation
 from .MegaMixCollection import MegaMixCollections
 from .DataHandler import get_player_specific_ids
+from .SlotData import SLOT_DATA_VERSION, encode_song_ids, decode_song_ids, decode_slot_data
+from .Profiling import timed
 
 #Python
 import typing
@@ -70,6 +72,15 @@ class MegaMixWebWorld(WebWorld):
     bug_report_page = "https://github.com/Cynichill/DivaAPworld/issues"
     option_groups = megamix_option_groups
 
+class PlandoSongs(typing.NamedTuple):
+    """Plando options resolved for one player. Lists keep the order songs are drawn from."""
+
+    start_items: set[str]
+    starting_songs: List[str]
+    included_songs: List[str]
+    excluded_songs: set[str]
+
+
 class MegaMixWorld(World):
     """Hatsune Miku: Project Diva Mega Mix+ is a rhythm game where you hit notes to the beat of one of 250+ songs.
     Play through a selection of randomly chosen songs, collecting leeks
@@ -95,49 +106,59 @@ class MegaMixWorld(World):
     item_name_groups = mm_collection.get_item_name_groups()
 
     # Working Data
-    player_specific_mod_data = {}
-    player_specific_ids = {}
+    player_specific_mod_data: dict[str, list]
+    player_specific_ids: set[int]
     victory_song_name: str = ""
     victory_song_id: int
-    starting_songs: List[str] = []
+    starting_songs: List[str]
     included_songs: List[str]
-    final_song_ids: set[int] = set()
+    final_song_ids: set[int]
     needed_token_count: int
     location_count: int
 
+    def __init__(self, multiworld: MultiWorld, player: int):
+        super().__init__(multiworld, player)
+        # Per slot, as every Mega Mix world in the multiworld shares the class
+        self.player_specific_mod_data = {}
+        self.player_specific_ids = set()
+        self.starting_songs = []
+        self.included_songs = []
+        self.final_song_ids = set()
+
+    @timed()
     def generate_early(self):
         re_gen_passthrough = getattr(self.multiworld, "re_gen_passthrough", {})
         if re_gen_passthrough and self.game in re_gen_passthrough:
             slot_data: dict[str, any] = re_gen_passthrough[self.game]
 
             if "finalSongIDs" in slot_data:
-                final = slot_data.get("finalSongIDs", [])
+                final = set(decode_song_ids(slot_data.get("finalSongIDs", [])))
                 self.included_songs = [key for key, song in self.mm_collection.song_items.items() if song.songID in final]
                 self.location_count = len(self.included_songs) * 2
             return
 
-        # Initial search criteria
+        self.player_specific_mod_data, player_specific_ids = get_player_specific_ids(self.options.megamix_mod_data.value)
+        self.player_specific_ids = set(player_specific_ids)
+
+        final_song_list = self.find_song_pool()
+        self.create_song_pool(final_song_list)
+
+        for song in self.starting_songs:
+            self.multiworld.push_precollected(self.create_item(song))
+
+    def expand_thresholds(self) -> typing.Iterator[typing.Tuple[List[int], float, float]]:
+        """
+        Search criteria as (allowed difficulties, min rating, max rating), starting from the options.
+        Each step widens by 0.5 stars: lower the min rating to 1, raise the max rating past 10,
+        then reset the ratings and lower/raise the difficulty. Raises OptionError once everything is allowed.
+        """
         lower_rating_threshold, higher_rating_threshold = self.get_difficulty_range()
         lower_diff_threshold, higher_diff_threshold = self.get_available_difficulties(self.options.song_difficulty_min.value, self.options.song_difficulty_max.value)
-        self.player_specific_mod_data, self.player_specific_ids = get_player_specific_ids(self.options.megamix_mod_data.value)
 
         while True:
-            # In most cases this should only need to run once
-
             allowed_difficulties = list(range(lower_diff_threshold, higher_diff_threshold + 1))
-            available_song_keys = self.mm_collection.get_songs_with_settings(self.options.allow_megamix_dlc_songs, self.player_specific_ids, allowed_difficulties, lower_rating_threshold, higher_rating_threshold)
+            yield allowed_difficulties, lower_rating_threshold, higher_rating_threshold
 
-            available_song_keys = self.handle_plando(available_song_keys)
-            #print(f"{lower_rating_threshold}~{higher_rating_threshold}* {allowed_difficulties}", len(available_song_keys))
-
-            # The minimum amount of songs to make an ok rando would be Starting Songs + 10 interim songs + Goal song.
-            # - Interim songs being equal to max starting song count.
-            count_needed_for_start = max(0, self.options.starting_song_count.value - len(self.starting_songs)) + 11
-            if len(available_song_keys) + len(self.included_songs) >= count_needed_for_start:
-                final_song_list = available_song_keys
-                break
-
-            # If the above fails, we want to adjust the difficulty thresholds.
             # Easier first, then harder
             if lower_rating_threshold <= 1 and higher_rating_threshold >= 10 and len(allowed_difficulties) >= 5:
                 raise OptionError("Failed to find enough songs, even with maximum difficulty thresholds.")
@@ -155,24 +176,63 @@ class MegaMixWorld(World):
             else:
                 lower_rating_threshold -= 0.5
 
-        self.create_song_pool(final_song_list)
+    def find_song_pool(self) -> List[str]:
+        """
+        Songs after plando at the first search criteria of expand_thresholds() with enough of them.
+        When plando can't draw from the RNG (no goal song option, nothing to include), criteria that fall short
+        are ruled out by counting instead of running handle_plando, so seeds play out the same as trying each step.
+        """
+        starting_song_count = self.options.starting_song_count.value
+        plando = self.resolve_plando()
 
-        for song in self.starting_songs:
-            self.multiworld.push_precollected(self.create_item(song))
+        plando_is_random = bool(self.options.goal_song.value) or bool(plando.included_songs and self.options.include_songs_percentage.value)
+        skipped_songs = plando.start_items | plando.excluded_songs | set(plando.included_songs)
+        included_count = len([s for s in plando.included_songs if s not in plando.excluded_songs])
+        count_needed = max(0, starting_song_count - len(plando.starting_songs)) + 11
+
+        for allowed_difficulties, lower_rating_threshold, higher_rating_threshold in self.expand_thresholds():
+            if not plando_is_random and self.mm_collection.count_songs_upper_bound(
+                    allowed_difficulties, lower_rating_threshold, higher_rating_threshold) + included_count < count_needed:
+                continue
+
+            available_song_keys = self.mm_collection.get_songs_with_settings(self.options.allow_megamix_dlc_songs, self.player_specific_ids, allowed_difficulties, lower_rating_threshold, higher_rating_threshold)
+
+            # Same count handle_plando would give, without the pool
+            if not plando_is_random and sum(s not in skipped_songs for s in available_song_keys) + included_count < count_needed:
+                continue
+
+            available_song_keys = self.handle_plando(available_song_keys, plando)
+            #print(f"{lower_rating_threshold}~{higher_rating_threshold}* {allowed_difficulties}", len(available_song_keys))
+
+            # The minimum amount of songs to make an ok rando would be Starting Songs + 10 interim songs + Goal song.
+            # - Interim songs being equal to max starting song count.
+            count_needed_for_start = max(0, starting_song_count - len(self.starting_songs)) + 11
+            if len(available_song_keys) + len(self.included_songs) >= count_needed_for_start:
+                return available_song_keys
 
-    def handle_plando(self, available_song_keys: List[str]) -> List[str]:
+    def resolve_plando(self) -> PlandoSongs:
+        """Resolve start_inventory, include_songs and exclude_songs against this player's songs."""
         song_items = self.mm_collection.song_items
 
-        start_items = self.options.start_inventory.value.keys()
-        include_songs = sorted(self.options.include_songs.value)
-        exclude_songs = self.options.exclude_songs.value
-        goal_songs = sorted(self.options.goal_song.value.intersection(set(available_song_keys)))
+        def is_own_song(name: str) -> bool:
+            # The ModdedSongs group is shared across all players. Limit to own songs.
+            song = song_items.get(name)
+            return song is not None and (not song.modded or song.songID in self.player_specific_ids)
+
+        start_items = self.options.start_inventory.value
+        starting_songs = [s for s in start_items if is_own_song(s)]
+        starting_set = set(starting_songs)
+        included_songs = [s for s in sorted(self.options.include_songs.value) if s not in starting_set and is_own_song(s)]
+
+        return PlandoSongs(set(start_items), starting_songs, included_songs, set(self.options.exclude_songs.value))
+
+    def handle_plando(self, available_song_keys: List[str], plando: typing.Optional[PlandoSongs] = None) -> List[str]:
+        if plando is None:
+            plando = self.resolve_plando()
 
-        # The ModdedSongs group is shared across all players. Limit to own songs.
-        self.starting_songs = [s for s in start_items if s in song_items and
-                               not song_items.get(s).modded or song_items.get(s).songID in self.player_specific_ids]
-        included_songs = [s for s in include_songs if s in song_items and s not in self.starting_songs and
-                               not song_items.get(s).modded or song_items.get(s).songID in self.player_specific_ids]
+        self.starting_songs = list(plando.starting_songs)
+        included_songs = list(plando.included_songs)
+        goal_songs = sorted(self.options.goal_song.value.intersection(available_song_keys))
 
         # Handle goal before inc%
         if goal_songs:
@@ -183,14 +243,15 @@ class MegaMixWorld(World):
                 included_songs.remove(self.victory_song_name)
 
         # Open to suggestions to make includes% make sense without touching create_song_pool.
-        pool = [s for s in available_song_keys if s not in start_items
-                and s not in included_songs and s not in exclude_songs]
-        pool_size = 1 + min(len(pool + self.starting_songs + included_songs),
+        skipped_songs = plando.start_items | plando.excluded_songs | set(included_songs)
+        pool = [s for s in available_song_keys if s not in skipped_songs]
+        pool_size = 1 + min(len(pool) + len(self.starting_songs) + len(included_songs),
                             self.options.starting_song_count.value + self.options.additional_song_count.value)
         include_size = pool_size * self.options.include_songs_percentage.value // 100
 
         self.included_songs = self.random.sample(included_songs, k=min(len(included_songs), include_size))
-        pool += [s for s in included_songs if s not in self.included_songs and s not in exclude_songs]
+        selected_songs = set(self.included_songs)
+        pool += [s for s in included_songs if s not in selected_songs and s not in plando.excluded_songs]
 
         return pool
 
@@ -257,78 +318,82 @@ class MegaMixWorld(World):
         self.final_song_ids.add(song.songID)
         return MegaMixSongItem(name, self.player, song)
 
+    @timed()
     def create_items(self) -> None:
         song_keys_in_pool = self.included_songs.copy()
+        song_data = {name: self.mm_collection.song_items[name] for name in song_keys_in_pool}
+        self.final_song_ids.update(song.songID for song in song_data.values())
 
         # Note: Item count will be off if plando is involved.
         item_count = self.get_leek_count()
 
         # First add all goal song tokens
-        for _ in range(0, item_count):
-            self.multiworld.itempool.append(self.create_item(self.mm_collection.LEEK_NAME))
+        items = self.create_fixed_items([self.mm_collection.LEEK_NAME] * item_count)
 
         # Then add 1 copy of every song
         item_count += len(self.included_songs)
-        for song in self.included_songs:
-            self.multiworld.itempool.append(self.create_item(song))
+        items += [MegaMixSongItem(song, self.player, song_data[song]) for song in self.included_songs]
 
         # At this point, if a player is using traps, it's possible that they have filled all locations
         items_left = self.location_count - item_count
         if items_left <= 0:
+            self.multiworld.itempool += items
             return
-          
+
         # Fill given percentage of remaining slots as Useful/non-progression dupes.
         dupe_count = items_left * self.options.duplicate_song_percentage // 100
         items_left -= dupe_count
 
         # This is for the extraordinary case of needing to fill a lot of items.
         while dupe_count > len(song_keys_in_pool):
-            for key in song_keys_in_pool:
-                item = self.create_item(key)
-                item.classification = ItemClassification.useful
-                self.multiworld.itempool.append(item)
-
+            items += [MegaMixSongItem(key, self.player, song_data[key], ItemClassification.useful) for key in song_keys_in_pool]
             dupe_count -= len(song_keys_in_pool)
-            continue
 
         self.random.shuffle(song_keys_in_pool)
-        for i in range(0, dupe_count):
-            item = self.create_item(song_keys_in_pool[i])
-            item.classification = ItemClassification.useful
-            self.multiworld.itempool.append(item)
+        items += [MegaMixSongItem(key, self.player, song_data[key], ItemClassification.useful)
+                  for key in song_keys_in_pool[:dupe_count]]
 
         # Traps after dupes, contrary to MD
         trap_count = items_left * self.options.trap_percentage // 100
         enabled_traps = list(self.options.traps_enabled.value)
 
         if enabled_traps and trap_count:
-            for _ in range(0, trap_count):
-                trap = self.create_item(self.random.choice(enabled_traps))
-                self.multiworld.itempool.append(trap)
-
+            # One choice() per trap, as choices(k=) would draw different traps for the same seed
+            items += self.create_fixed_items([self.random.choice(enabled_traps) for _ in range(trap_count)])
             items_left -= trap_count  # subtract only if there are enabled traps
 
         # Generic filler. Anything dupes and traps didn't cover.
-        filler_count = items_left
-        items_left -= filler_count
+        # A weighted choices(k=) draws the same as one choices() per item.
+        items += self.create_fixed_items(self.random.choices(self.filler_item_names, self.filler_item_weights, k=items_left))
 
-        for _ in range(0, filler_count):
-            filler_item = self.create_item(self.random.choices(self.filler_item_names, self.filler_item_weights)[0])
-            self.multiworld.itempool.append(filler_item)
+        self.multiworld.itempool += items
 
+    def create_fixed_items(self, names: List[str]) -> List[Item]:
+        """Leeks, filler and traps, looking up the code and classification once per distinct name."""
+        kinds = {name: self.create_item(name) for name in set(names)}
+        return [MegaMixFixedItem(name, kinds[name].classification, kinds[name].code, self.player) for name in names]
+
+    @timed()
     def create_regions(self) -> None:
         menu_region = Region("Menu", self.player, self.multiworld)
         self.multiworld.regions += [menu_region]
 
         all_selected_locations = self.starting_songs + self.included_songs
+        song_location_pairs = self.mm_collection.song_location_pairs
+        player = self.player
+        locations = []
 
-        # Adds 2 item locations per song to the menu region.
+        # Adds 2 item locations per song to the menu region, sharing one rule.
         for name in all_selected_locations:
-            for j in range(2):
-                loc = MegaMixLocation(self.player, f"{name}-{j}", self.mm_collection.song_locations[f"{name}-{j}"], menu_region)
-                loc.access_rule = lambda state, item=name: state.has(item, self.player)
-                menu_region.locations.append(loc)
+            rule = lambda state, item=name: state.has(item, player)
+            for location_name, code in song_location_pairs[name]:
+                loc = MegaMixLocation(player, location_name, code, menu_region)
+                loc.access_rule = rule
+                locations.append(loc)
+
+        menu_region.locations += locations
 
+    @timed()
     def set_rules(self) -> None:
         self.multiworld.completion_condition[self.player] = lambda state: \
             state.has(self.mm_collection.LEEK_NAME, self.player, self.get_leek_win_count())
@@ -366,18 +431,20 @@ class MegaMixWorld(World):
 
     @staticmethod
     def interpret_slot_data(slot_data: dict[str, any]) -> dict[str, any]:
-        return slot_data
+        return decode_slot_data(slot_data)
 
+    @timed()
     def fill_slot_data(self):
         return {
+            "slotDataVersion": SLOT_DATA_VERSION,
             "victoryLocation": self.victory_song_name,
             "victoryID": self.victory_song_id,
-            "finalSongIDs": self.final_song_ids,
+            "finalSongIDs": encode_song_ids(self.final_song_ids),
             "leekWinCount": self.get_leek_win_count(),
             "scoreGradeNeeded": self.options.grade_needed.value,
             "autoRemove": bool(self.options.auto_remove_songs),
             "deathLink": self.options.death_link.value,
             "deathLink_Amnesty": self.options.death_link_amnesty.value,
-            "modData": {pack: [song[1] for song in songs if song[1] in self.final_song_ids]
+            "modData": {pack: encode_song_ids(song[1] for song in songs if song[1] in self.final_song_ids)
                         for pack, songs in self.player_specific_mod_data.items()},
         }
@@ -1,7 +1,6 @@
 import os
 import pkgutil
 import re
-from pathlib import Path
 
 from kvui import ThemedApp, ScrollBox, MDTextField, MDBoxLayout, MDLabel
 from kivy.core.clipboard import Clipboard
@@ -18,6 +17,7 @@ import settings
 from .json_megamix import process_mods, ConflictException
 from .. import MegaMixWorld
 from ..DataHandler import restore_originals, game_paths
+from ..ModsIndex import mods_index
 
 
 class AssociatedMDLabel(MDLabel):
@@ -47,14 +47,8 @@ class DivaJSONGenerator(ThemedApp):
     def create_pack_list(self):
         self.labels = []
         self.pack_list_scroll.layout.clear_widgets()
-        mods_folder = Path(self.mods_folder)
-
-        for root, _, files in os.walk(self.mods_folder):
-            if not 'mod_pv_db.txt' in files:
-                continue
-
-            folder_name = str(Path(root).parent.relative_to(mods_folder))
 
+        for folder_name in sorted(mods_index().refresh().packs):
             if folder_name.startswith(self.self_mod_name):
                 continue
 
@@ -118,8 +112,8 @@ class DivaJSONGenerator(ThemedApp):
             self.pack_list_scroll.layout.add_widget(label.parent)
 
     def process_to_clipboard(self):
-        checked_packs = [str(os.path.join(self.mods_folder, label.text)) for label in self.labels if label.associate.active]
-        mod_pv_db_paths_list = [os.path.join(folder_path, "rom", "mod_pv_db.txt") for folder_path in checked_packs]
+        checked_packs = [label.text for label in self.labels if label.associate.active]
+        mod_pv_db_paths_list = mods_index().pv_db_paths(checked_packs)
 
         if not mod_pv_db_paths_list:
             self.show_snackbar("No song packs selected")
@@ -170,9 +164,8 @@ class DivaJSONGenerator(ThemedApp):
         MDSnackbar(MDSnackbarText(text=message)).open()
 
     def process_restore_originals(self):
-        mod_pv_dbs = [f"{self.mods_folder}/{pack}/rom/mod_pv_db.txt" for pack in [label.text for label in self.labels] + [self.self_mod_name]]
         try:
-            restore_originals(mod_pv_dbs)
+            restore_originals(mods_index().refresh().pv_db_paths())
             self.show_snackbar("Song packs restored")
         except Exception as e:
             self.show_snackbar(str(e))
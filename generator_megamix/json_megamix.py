@@ -5,10 +5,13 @@ import re
 
 from ..SymbolFixer import fix_song_name
 from ..MegaMixSongData import base_game_ids
+from ..DifficultyCodec import decode_difficulty, encode_difficulties, encode_difficulty
+from ..Profiling import timed
 
 class ConflictException(Exception):
     pass
 
+@timed()
 def process_mods(mods_folder: str, mod_pv_dbs_path_list: list[str]) -> tuple[int, str]:
     """
     Accumulates song metadata across the provided mod_pv_dbs and returns JSON.
@@ -38,9 +41,10 @@ def process_mods(mods_folder: str, mod_pv_dbs_path_list: list[str]) -> tuple[int
     return len(unique_seen_ids), finalize_json(mod_song_collection)
 
 def process_single_mod(mod_pv_db_path: str, mod_dir: str) -> tuple[set[int], list[list[str,int,int]]]:
-    difficulties = ["exextreme", "extreme", "hard", "normal", "easy"] # see shift_difficulty()
+    difficulties = ["exextreme", "extreme", "hard", "normal", "easy"] # Reversed for encode_difficulties()
     songs = {}
     song_pack_ids = set()
+    diff_ratings = {}
     diff_lockout = {} # Well if it isn't the consequences of my own actions.
 
     with open(mod_pv_db_path, "r", encoding='utf-8') as input_file:
@@ -50,6 +54,7 @@ def process_single_mod(mod_pv_db_path: str, mod_dir: str) -> tuple[set[int], lis
     for line in sorted(mod_pv_db):
         song_id, song_prop, diff_rating, diff_index_length, diff_prop, value = line
         songs.setdefault(song_id, ["", int(song_id), 0])
+        diff_ratings.setdefault(song_id, [0.0] * 5)
         diff_lockout.setdefault(song_id, [False] * 5)
         song_pack_ids.add(song_id)
 
@@ -69,31 +74,26 @@ def process_single_mod(mod_pv_db_path: str, mod_dir: str) -> tuple[set[int], lis
 
                 if diff_index_length == "length" and value == "0":
                     diff_lockout[song_id][diff_index] = True
-                    songs[song_id][2] = shift_difficulty(songs[song_id][2], diff_index, 31.0)
 
                 match diff_prop:
                     case "level" if not diff_lockout[song_id][diff_index]:
-                        songs[song_id][2] = shift_difficulty(songs[song_id][2], diff_index, float(".".join(value.split("_")[2:4])))
+                        rating = float(".".join(value.split("_")[2:4]))
+                        previous = diff_ratings[song_id][diff_index]
+                        if previous: # Repeated levels of a difficulty were always ORed together in the bitfield
+                            rating = decode_difficulty(encode_difficulty([previous]) | encode_difficulty([rating]))[0]
+                        diff_ratings[song_id][diff_index] = rating
                     case "script_file_name" if int(song_id) not in base_game_ids: # 99% covers. Good luck everyone.
                         if not os.path.isfile(os.path.join(mod_dir, value)): # Verify DSC exists
                             print(f"{song_id} No {difficulties[diff_index]} DSC at {value}")
                             diff_lockout[song_id][diff_index] = True
-                            songs[song_id][2] = shift_difficulty(songs[song_id][2], diff_index, 31.0)
 
-    return song_pack_ids, [songs[song] for song in songs]
-
-def shift_difficulty(current_diffs: int = 0, index: int = 0, level_float: float = 0.0) -> int:
-    """
-    Accumulates difficulties in a bitfield to save space in the export.
-    Easy MSB (index 4) <- ExEx LSB (index 0) due to Ex/ExEx prevalence.
-    Each diff is stored as 5 bits with MSB indicating the .5: 9.5 = 0b11001
-    Masks off missing DSCs with NOT 31. Locking handled in caller.
-    """
-
-    level_int = (int(level_float) | (not level_float.is_integer()) << 4) << 5 * index
-    current_diffs = current_diffs & ~level_int if level_float == 31 else current_diffs | level_int
+    # The whole pack at once, Easy first
+    packed = encode_difficulties([diff_ratings[song_id][::-1] for song_id in songs],
+                                 [diff_lockout[song_id][::-1] for song_id in songs])
+    for song, difficulty in zip(songs.values(), packed):
+        song[2] = difficulty
 
-    return current_diffs
+    return song_pack_ids, [songs[song] for song in songs]
 
 def finalize_json(mod_song_collection: dict) -> str:
     output = json.dumps(mod_song_collection, separators=(',', ':'))
@@ -0,0 +1,154 @@
+"""
+Generation benchmark for the Mega Mix world. Not collected as a test.
+
+Run from the Archipelago folder, with the world installed as worlds/<folder>:
+  python -m worlds.<folder>.test.benchmark_generation --slots 1 10 --output before.json
+
+Every combination of slot count, additional_song_count, duplicate and trap percentage is generated once.
+All slots get the same synthetic megamix_mod_data pack, added to the collection before generating.
+Reports wall time and tracemalloc peak per stage as JSON, so runs can be diffed across commits.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from argparse import Namespace
+from typing import Dict, List, Optional
+
+from BaseClasses import CollectionState, MultiWorld
+from worlds.AutoWorld import call_all
+
+from .. import MegaMixWorld
+from ..DifficultyCodec import encode_difficulties
+
+STAGES = ["generate_early", "create_regions", "create_items", "set_rules", "generate_basic", "pre_fill"]
+MOD_PACK = "BenchmarkPack"
+MOD_FIRST_ID = 5000
+
+
+def synthetic_mod_data(count: int) -> Dict[str, list]:
+    """A pack of count songs with ratings spread over every difficulty and 1 to 10 stars."""
+    ratings = [[(i + slot) % 19 * 0.5 + 1.0 if (i + slot) % 7 else 0.0 for slot in range(5)] for i in range(count)]
+    packed = encode_difficulties(ratings)
+    return {MOD_PACK: [[f"Benchmark Song {i}", MOD_FIRST_ID + i, packed[i]] for i in range(count)]}
+
+
+def add_mod_songs(mod_data: Dict[str, list]) -> None:
+    """Add the songs to the shared collection and to the world's lookups, as the YAML scan would have."""
+    collection = MegaMixWorld.mm_collection
+    collection.add_mod_data([mod_data])
+
+    for name, song_id in dict(collection.item_names_to_id).items():
+        MegaMixWorld.item_name_to_id.setdefault(name, song_id)
+        MegaMixWorld.item_id_to_name.setdefault(song_id, name)
+    for name, location_id in collection.song_locations.items():
+        MegaMixWorld.location_name_to_id.setdefault(name, location_id)
+        MegaMixWorld.location_id_to_name.setdefault(location_id, name)
+
+
+def setup_multiworld(slots: int, options: dict, seed: int) -> MultiWorld:
+    multiworld = MultiWorld(slots)
+    multiworld.game = {player: MegaMixWorld.game for player in range(1, slots + 1)}
+    multiworld.player_name = {player: f"Bench{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+
+    args = Namespace()
+    for name, option in MegaMixWorld.options_dataclass.type_hints.items():
+        value = options.get(name, option.default)
+        setattr(args, name, {player: option.from_any(value) for player in multiworld.player_ids})
+
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def measure(results: Dict[str, dict], stage: str, function) -> None:
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    function()
+    results[stage] = {
+        "seconds": round(time.perf_counter() - start, 6),
+        "peak_bytes": tracemalloc.get_traced_memory()[1],
+    }
+
+
+def run_scenario(slots: int, options: dict, seed: int) -> dict:
+    stages: Dict[str, dict] = {}
+    multiworld: Optional[MultiWorld] = None
+
+    def setup():
+        nonlocal multiworld
+        multiworld = setup_multiworld(slots, options, seed)
+
+    measure(stages, "setup", setup)
+    for stage in STAGES:
+        measure(stages, stage, lambda: call_all(multiworld, stage))
+    measure(stages, "fill_slot_data", lambda: [world.fill_slot_data() for world in multiworld.worlds.values()])
+
+    return {
+        "slots": slots,
+        "options": {name: value for name, value in options.items() if name != "megamix_mod_data"},
+        "seed": seed,
+        "items": len(multiworld.itempool),
+        "locations": sum(1 for _ in multiworld.get_locations()),
+        "total_seconds": round(sum(stage["seconds"] for stage in stages.values()), 6),
+        "stages": stages,
+    }
+
+
+def commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(__file__), capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--songs", type=int, nargs="+", default=[40, 1000, 3900], help="additional_song_count")
+    parser.add_argument("--dupes", type=int, nargs="+", default=[0, 100], help="duplicate_song_percentage")
+    parser.add_argument("--traps", type=int, nargs="+", default=[0, 50], help="trap_percentage")
+    parser.add_argument("--mod-songs", type=int, default=4000, help="songs in the synthetic mod pack")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    mod_data = synthetic_mod_data(args.mod_songs)
+    tracemalloc.start()
+    start = time.perf_counter()
+    add_mod_songs(mod_data)
+    load_seconds = round(time.perf_counter() - start, 6)
+
+    base_options = {"megamix_mod_data": json.dumps(mod_data, separators=(",", ":")), "allow_megamix_dlc_songs": True}
+    results = []
+    for slots, songs, dupes, traps in itertools.product(args.slots, args.songs, args.dupes, args.traps):
+        options = dict(base_options, additional_song_count=songs, duplicate_song_percentage=dupes, trap_percentage=traps)
+        result = run_scenario(slots, options, args.seed)
+        results.append(result)
+        print(f"{slots} slots, {songs} songs, {dupes}% dupes, {traps}% traps: {result['total_seconds']:.2f}s",
+              file=sys.stderr)
+
+    report = json.dumps({
+        "commit": commit(),
+        "python": platform.python_version(),
+        "mod_songs": args.mod_songs,
+        "mod_load_seconds": load_seconds,
+        "results": results,
+    }, indent=1)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
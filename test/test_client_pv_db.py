@@ -1,5 +1,11 @@
+import asyncio
+import os
+import tempfile
+
 from . import MegaMixTestBase
+from ..ClientState import ClientState, pv_db_exceptions
 from ..DataHandler import modify_mod_pv, remove_song
+from ..ModPVDB import ModPVDB, PVDBJournal, PVDBState, PVDBWriter, PendingPVDB
 
 class TestClientPVDB(MegaMixTestBase):
 
@@ -44,3 +50,157 @@ class TestClientPVDB(MegaMixTestBase):
         result = remove_song(result, "144|700")
 
         self.assertMultiLineEqual(start, result)
+
+    def test_pv_db_freeplay(self):
+        """Verify inverted targets enable everything but the given IDs, leaving other lines alone."""
+        start = """#ARCH#pv_123.difficulty.hard.length=1
+pv_123.song_name_en=Test
+pv_124.difficulty.extreme.length=1
+#ARCH#pv_125.difficulty.normal.length=1"""
+
+        good = """pv_123.difficulty.hard.length=1
+pv_123.song_name_en=Test
+#ARCH#pv_124.difficulty.extreme.length=1
+pv_125.difficulty.normal.length=1"""
+
+        pv_db = ModPVDB(start)
+        pv_db.enable({"124"}, invert=True)
+        pv_db.disable({"124"})
+
+        self.assertMultiLineEqual(good, pv_db.text)
+        self.assertEqual({"123", "125"}, pv_db.enabled_ids())
+
+    def test_pv_db_dirty(self):
+        """Verify no-op toggles do not mark the pv_db as changed."""
+        pv_db = ModPVDB("pv_123.difficulty.extreme.length=1\n#ARCH#pv_124.difficulty.extreme.length=1\n")
+        pv_db.enable({"123"})
+        pv_db.disable({"124", "144"})
+        self.assertFalse(pv_db.dirty)
+
+        pv_db.disable({"123"})
+        self.assertTrue(pv_db.dirty)
+        pv_db.enable({"123"})
+        self.assertFalse(pv_db.dirty)
+
+    def test_pv_db_journal_restore(self):
+        """Verify journaled lines are reverted and the journal removed on restore."""
+        start = "pv_123.difficulty.extreme.length=1\n#ARCH#pv_124.difficulty.extreme.length=1\npv_125.song_name_en=Test\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "mod_pv_db.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(start)
+
+            pv_db = ModPVDB.load(file_path)
+            pv_db.disable({"123"})
+            pv_db.enable({"124"})
+            self.assertTrue(pv_db.save(file_path))
+            self.assertTrue(os.path.isfile(PVDBJournal.journal_path(file_path)))
+
+            self.assertTrue(PVDBJournal.load(file_path).restore())
+            self.assertFalse(os.path.isfile(PVDBJournal.journal_path(file_path)))
+
+            with open(file_path, "r", encoding="utf-8") as file:
+                self.assertMultiLineEqual(start, file.read())
+
+    def test_pv_db_journal_deleted_externally(self):
+        """Verify a journal restored and removed by another process is written again on the next change."""
+        start = "pv_123.difficulty.extreme.length=1\npv_124.difficulty.extreme.length=1\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "mod_pv_db.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(start)
+
+            pv_db = ModPVDB.load(file_path)
+            pv_db.disable({"123"})
+            self.assertTrue(pv_db.save(file_path))
+
+            # The JSON generator restores the file and removes the journal, the cache is left behind
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(start)
+            os.remove(PVDBJournal.journal_path(file_path))
+
+            pv_db = ModPVDB.load(file_path)
+            pv_db.disable({"123"})
+            self.assertTrue(pv_db.save(file_path))
+            self.assertTrue(os.path.isfile(PVDBJournal.journal_path(file_path)))
+
+            # Crash: a new process only has the journal on disk
+            PVDBJournal.cache.clear()
+            self.assertTrue(PVDBJournal.load(file_path).restore())
+            with open(file_path, "r", encoding="utf-8") as file:
+                self.assertMultiLineEqual(start, file.read())
+
+    def test_pv_db_known_state(self):
+        """Verify the writer predicts the result of queued changes and skips files left as they are."""
+        start = "pv_123.difficulty.extreme.length=1\n#ARCH#pv_124.difficulty.extreme.length=1\npv_144.difficulty.extreme.length=1\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "mod_pv_db.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(start)
+
+            writer = PVDBWriter(always_disabled={"125"})
+            pending = PendingPVDB()
+            pending.base = False
+            pending.songs = {"124": True}
+            self.assertEqual(1, writer.write({file_path: pending}))
+
+            state = writer.applied[file_path]
+            self.assertEqual(PVDBState.of(file_path, ModPVDB.load(file_path)), state)
+            self.assertEqual({"124", "144"}, state.enabled)
+
+            pending.songs = {"123": True}
+            self.assertEqual({"123", "144"}, pending.enabled_after(state, writer.always_disabled))
+
+            pending.songs = {"124": True}
+            self.assertEqual(state.enabled, pending.enabled_after(state))
+            self.assertEqual(0, writer.write({file_path: pending}))
+
+    def test_pv_db_set_state(self):
+        """Verify set_state replaces queued changes and a file already in that state is not written again."""
+        start = "pv_123.difficulty.extreme.length=1\npv_124.difficulty.extreme.length=1\n#ARCH#pv_125.difficulty.extreme.length=1\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "mod_pv_db.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(start)
+
+            async def set_state():
+                writer.set_state(file_path, True, {"123"})
+                writer.set_state(file_path, False, {"124"})
+                return writer.flush()
+
+            writer = PVDBWriter()
+            self.assertEqual(1, asyncio.run(set_state()))
+            self.assertEqual({"124"}, ModPVDB.load(file_path).enabled_ids())
+            self.assertEqual(0, asyncio.run(set_state()))
+
+    def test_pv_db_freeplay_shared_id(self):
+        """Verify freeplay keeps an unreceived song disabled in every pv_db that has its ID, not only its pack's."""
+        start = "#ARCH#pv_123.difficulty.extreme.length=1\n#ARCH#pv_124.difficulty.extreme.length=1\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            pack, cover_pack = os.path.join(directory, "pack.txt"), os.path.join(directory, "cover_pack.txt")
+            for file_path in (pack, cover_pack):
+                with open(file_path, "w", encoding="utf-8") as file:
+                    file.write(start)
+
+            state = ClientState()
+            state.connect([1230, 1231, 1240, 1241], [])
+            state.receive_song(1240)
+
+            for freeplay, enabled in ((True, {"124"}), (False, {"124"})):
+                songs = state.exception_songs(freeplay, 125, False)
+                exceptions = pv_db_exceptions([pack, cover_pack], songs, freeplay, lambda song_id: pack)
+
+                async def sync():
+                    for file_path, song_ids in exceptions.items():
+                        writer.set_state(file_path, freeplay, song_ids)
+                    writer.flush()
+
+                writer = PVDBWriter()
+                asyncio.run(sync())
+                self.assertEqual(enabled, ModPVDB.load(pack).enabled_ids())
+                self.assertEqual(enabled if freeplay else set(), ModPVDB.load(cover_pack).enabled_ids())
@@ -0,0 +1,53 @@
+import unittest
+
+from NetUtils import NetworkItem
+
+from ..ClientState import ClientState
+
+
+class TestClientState(unittest.TestCase):
+    """Songs move from uncleared to cleared as their locations are found."""
+
+    def test_progress(self):
+        state = ClientState()
+        state.connect([10, 11, 20, 21, 31], [30])
+        for item_id in (10, 30, 50):
+            state.receive_song(item_id)
+
+        self.assertEqual({1, 3}, state.uncleared_songs())
+        self.assertEqual({2}, state.unreceived_songs())
+        self.assertFalse(state.is_cleared(1))
+
+        state.mark_found([10])
+        self.assertFalse(state.is_cleared(1))
+        state.mark_found([11, 31])
+        self.assertTrue(state.is_cleared(1))
+        self.assertEqual({1, 3}, state.cleared_songs())
+        self.assertEqual(set(), state.uncleared_songs())
+        self.assertFalse(state.is_cleared(5))
+
+        state.clear_received()
+        self.assertEqual({1, 2, 3}, state.unreceived_songs())
+
+    def test_received_cursor(self):
+        """Items are taken once, and all again when the server resends the full list."""
+        state = ClientState()
+        state.connect([10, 11, 20, 21, 30, 31], [])
+        items = [NetworkItem(item_id, 0, 1) for item_id in (10, 1, 20)]
+
+        self.assertEqual(items, state.take_received(items))
+        self.assertEqual([], state.take_received(items))
+        self.assertEqual(1, state.leeks)
+
+        items += [NetworkItem(1, 0, 1), NetworkItem(4, 0, 1)]
+        self.assertEqual(items[3:], state.take_received(items))
+        self.assertEqual((2, {1, 2}), (state.leeks, state.received_songs))
+
+        # Reconnecting: the server starts over from index 0 with fewer items than taken so far
+        resent = items[:2]
+        self.assertEqual(resent, state.take_received(resent))
+        self.assertEqual((1, {1}), (state.leeks, state.received_songs))
+
+        # then sends the rest
+        self.assertEqual(items[2:], state.take_received(items))
+        self.assertEqual((2, {1, 2}, 5), (state.leeks, state.received_songs, state.received_index))
@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from .. import DifficultyCodec
+from ..DifficultyCodec import decode_difficulties, encode_difficulties, shift_difficulty
+
+
+class TestDifficultyCodec(unittest.TestCase):
+    """Test the packed difficulty bitfield shared by the JSON generator and MegaMixCollections."""
+
+    def test_decode_known(self):
+        """Verify known mod data values decode Easy first."""
+        self.assertEqual([[0.0, 0.0, 0.0, 9.0, 9.5], [0.0, 0.0, 6.0, 8.0, 0.0]],
+                         decode_difficulties([0b01001_11001, 0b00110_01000_00000], as_list=True))
+
+    def test_round_trip(self):
+        """Verify encoding matches shift_difficulty and decodes back to the same ratings."""
+        ratings = [[1.0, 3.5, 5.0, 7.5, 0.0], [0.0, 0.0, 0.0, 0.0, 10.0], [2.0, 4.0, 6.0, 8.0, 8.5]]
+        packed = encode_difficulties(ratings)
+
+        for row, value in zip(ratings, packed):
+            shifted = 0
+            for index, rating in enumerate(reversed(row)):
+                if rating:
+                    shifted = shift_difficulty(shifted, index, rating)
+            self.assertEqual(shifted, value)
+
+        self.assertEqual(ratings, decode_difficulties(packed, as_list=True))
+
+    def test_lockouts(self):
+        """Verify locked out difficulties are left out of the bitfield."""
+        self.assertEqual([0b01001_11001, 0], encode_difficulties([[0.0, 0.0, 6.0, 9.0, 9.5], [1.0, 2.0, 3.0, 4.0, 5.0]],
+                                                                [[False, False, True, False, False], [True] * 5]))
+
+    @unittest.skipIf(DifficultyCodec.np is None, "NumPy is not installed")
+    def test_numpy_matches_fallback(self):
+        """Verify the NumPy paths give the same results as the pure Python ones."""
+        ratings = [[(i + slot) % 21 * 0.5 for slot in range(5)] for i in range(200)]
+        lockouts = [[(i * slot) % 7 == 3 for slot in range(5)] for i in range(200)]
+
+        packed = encode_difficulties(ratings, lockouts)
+        decoded = decode_difficulties(packed, as_list=True)
+        self.assertNotIsInstance(decode_difficulties(packed), list)
+
+        with mock.patch.object(DifficultyCodec, "np", None):
+            self.assertEqual(packed, encode_difficulties(ratings, lockouts))
+            self.assertEqual(decoded, decode_difficulties(packed))
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import FileWatcher as file_watcher
+from ..FileWatcher import FileWatcher
+
+sleep = asyncio.sleep  # Polling's sleeps are recorded in test_polling
+
+
+class TestFileWatcher(unittest.IsolatedAsyncioTestCase):
+    """Each write of a watched file reaches its handler exactly once, with inotify or polling."""
+
+    async def asyncSetUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.folder = os.path.join(directory.name, "ArchipelagoMod")
+        os.mkdir(self.folder)
+
+        self.calls = []
+        self.watcher = FileWatcher(self.folder, min_interval=0.01, max_interval=0.05)
+        self.watcher.watch("results.json", self.calls.append)
+
+    async def asyncTearDown(self) -> None:
+        self.watcher.stop()
+        await sleep(0)  # Let a cancelled polling task finish
+
+    def write(self, text: str) -> None:
+        with open(os.path.join(self.folder, "results.json"), "w", encoding="utf-8") as file:
+            file.write(text)
+
+    async def wait_for(self, condition, timeout: float = 2.0) -> None:
+        for _ in range(int(timeout / 0.01)):
+            if condition():
+                return
+            await sleep(0.01)
+        self.fail("Timed out")
+
+    async def assert_dispatched_once(self) -> None:
+        self.write('{"pvId": 1}')
+        await self.wait_for(lambda: self.calls)
+        await sleep(0.1)  # Later events of the same write
+        self.assertEqual([os.path.join(self.folder, "results.json")], self.calls)
+
+    async def test_inotify(self):
+        self.watcher.start()
+        if self.watcher._fd is None:
+            self.skipTest("inotify is not available")
+
+        await self.assert_dispatched_once()
+
+    async def test_inotify_folder_removed(self):
+        """The watch ending (IN_IGNORED) switches to polling."""
+        self.watcher.start()
+        if self.watcher._fd is None:
+            self.skipTest("inotify is not available")
+
+        os.rmdir(self.folder)
+        await self.wait_for(lambda: self.watcher._poll_task is not None)
+        self.assertIsNone(self.watcher._fd)
+
+        os.mkdir(self.folder)
+        await self.assert_dispatched_once()
+
+    async def test_polling(self):
+        intervals = []
+
+        async def recording_sleep(interval):
+            intervals.append(interval)
+            await sleep(0.001)
+
+        with mock.patch.object(FileWatcher, "_start_inotify", return_value=False), \
+                mock.patch.object(file_watcher.asyncio, "sleep", recording_sleep):
+            self.watcher.start()
+            await self.wait_for(lambda: len(intervals) > 10)
+
+            # Slows down to max_interval while nothing changes, then polls quickly again after a change
+            self.assertEqual(self.watcher.min_interval, intervals[0])
+            self.assertEqual(self.watcher.max_interval, intervals[-1])
+            self.assertTrue(all(a <= b for a, b in zip(intervals, intervals[1:])))
+
+            count = len(intervals)
+            self.write('{"pvId": 1}')
+            await self.wait_for(lambda: self.calls)
+            await self.wait_for(lambda: len(intervals) > count + 2)
+            self.assertIn(self.watcher.min_interval, intervals[count:])
+
+        self.assertEqual([os.path.join(self.folder, "results.json")], self.calls)
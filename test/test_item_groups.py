@@ -0,0 +1,23 @@
+import unittest
+
+from .. import MegaMixWorld
+
+
+class TestItemGroups(unittest.TestCase):
+    """Verify the groups built from the song columns match the song data they came from."""
+
+    def test_singer_groups(self):
+        collection = MegaMixWorld.mm_collection
+        groups = collection.get_item_name_groups()
+
+        for singer, group in collection.SINGER_GROUPS.items():
+            expected = {name for name, data in collection.song_items.items() if not data.modded and singer in data.singers}
+            self.assertEqual(expected, groups[group], group)
+
+    def test_difficulty_groups(self):
+        collection = MegaMixWorld.mm_collection
+        groups = collection.get_item_name_groups()
+
+        for slot, group in enumerate(collection.DIFFICULTY_GROUPS):
+            expected = {name for name, data in collection.song_items.items() if not data.modded and data.difficulties[slot] > 0}
+            self.assertEqual(expected, groups[group], group)
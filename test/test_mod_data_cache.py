@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import DataHandler
+
+YAML = """name: Player{player}
+game: Hatsune Miku Project Diva Mega Mix+
+Hatsune Miku Project Diva Mega Mix+:
+  megamix_mod_data: '{mod_data}'
+"""
+
+
+class TestModDataCache(unittest.TestCase):
+    """Player files are parsed once and reused from the cache until they change."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.players = os.path.join(directory.name, "Players")
+        os.mkdir(self.players)
+
+        cache = os.path.join(directory.name, "cache")
+        for patch in (mock.patch.object(sys, "argv", ["Generate.py", "--player_files_path", self.players]),
+                      mock.patch.object(DataHandler.Utils, "cache_path", lambda *path: os.path.join(cache, *path))):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.parsed = []
+        extract = DataHandler.extract_file_mod_data
+
+        def counting_extract(item_path, known_hash=None):
+            self.parsed.append(os.path.basename(item_path))
+            return extract(item_path, known_hash)
+
+        patch = mock.patch.object(DataHandler, "extract_file_mod_data", counting_extract)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def write_player(self, player: int, mod_data: str) -> None:
+        with open(os.path.join(self.players, f"Player{player}.yaml"), "w", encoding="utf-8") as file:
+            file.write(YAML.format(player=player, mod_data=mod_data))
+
+    def extract(self) -> list:
+        self.parsed.clear()
+        return DataHandler.extract_mod_data_to_json()
+
+    def test_cache_hit(self):
+        self.write_player(1, '{"PackA":[["Song A",4000,1]]}')
+        self.write_player(2, '{"PackB":[["Song B",4001,2]]}')
+
+        expected = [{"PackA": [["Song A", 4000, 1]]}, {"PackB": [["Song B", 4001, 2]]}]
+        self.assertEqual(expected, self.extract())
+        self.assertEqual(["Player1.yaml", "Player2.yaml"], sorted(self.parsed))
+
+        self.assertEqual(expected, self.extract())
+        self.assertEqual([], self.parsed)
+
+    def test_stale_entry(self):
+        self.write_player(1, '{"PackA":[["Song A",4000,1]]}')
+        self.write_player(2, '{"PackB":[["Song B",4001,2]]}')
+        self.extract()
+
+        self.write_player(1, '{"PackA":[["Song A",4000,1],["Song C",4002,3]]}')
+        self.assertEqual([{"PackA": [["Song A", 4000, 1], ["Song C", 4002, 3]]}, {"PackB": [["Song B", 4001, 2]]}],
+                         self.extract())
+        self.assertEqual(["Player1.yaml"], self.parsed)
+
+    def test_deleted_pack(self):
+        self.write_player(1, '{"PackA":[["Song A",4000,1]]}')
+        self.write_player(2, '{"PackB":[["Song B",4001,2]]}')
+        self.extract()
+
+        os.remove(os.path.join(self.players, "Player2.yaml"))
+        self.assertEqual([{"PackA": [["Song A", 4000, 1]]}], self.extract())
+
+        self.write_player(1, '{}')
+        self.assertEqual([{}], self.extract())
+        self.assertEqual(["Player1.yaml"], self.parsed)
+
+    def test_pool_fallback(self):
+        """Many cold files go to a process pool, parsed in process when it can't start."""
+        count = DataHandler.MOD_DATA_POOL_THRESHOLD + 1
+        for player in range(count):
+            self.write_player(player, f'{{"Pack{player}":[["Song",{4000 + player},1]]}}')
+
+        with mock.patch.object(DataHandler, "mod_data_pool_available", lambda: True), \
+                mock.patch("concurrent.futures.ProcessPoolExecutor", side_effect=OSError("no pool")):
+            mod_data = self.extract()
+
+        self.assertEqual(count, len(self.parsed))
+        self.assertEqual(sorted([{f"Pack{player}": [["Song", 4000 + player, 1]]} for player in range(count)],
+                                key=lambda packs: list(packs)[0]), sorted(mod_data, key=lambda packs: list(packs)[0]))
@@ -0,0 +1,31 @@
+import os
+import tempfile
+import unittest
+
+from ..ModsIndex import ModsIndex, PV_DB_NAME
+
+
+class TestModsIndex(unittest.TestCase):
+    """Packs are found wherever a rom/mod_pv_db.txt sits, as os.walk found them."""
+
+    def test_nested_packs(self):
+        with tempfile.TemporaryDirectory() as mods:
+            def add(*path: str) -> None:
+                os.makedirs(os.path.join(mods, *path[:-1]), exist_ok=True)
+                open(os.path.join(mods, *path), "w").close()
+
+            add("PackA", "rom", PV_DB_NAME)
+            add("PackB", "config.toml")  # include = ["sub1", "sub2"]
+            add("PackB", "sub1", "rom", PV_DB_NAME)
+            add("PackB", "sub2", "rom", PV_DB_NAME)
+            add("Group", "PackC", "rom", PV_DB_NAME)
+            add("PackD", "rom", PV_DB_NAME)
+            add("PackD", "extra", "rom", PV_DB_NAME)
+            add("PackD", "rom", "nested", "rom", PV_DB_NAME)  # Assets are not scanned
+
+            expected = ["Group/PackC", "PackA", "PackB/sub1", "PackB/sub2", "PackD", "PackD/extra"]
+            index = ModsIndex(mods).refresh()
+            self.assertEqual([os.path.normpath(pack) for pack in expected], sorted(index.packs))
+
+            add("PackB", "sub3", "rom", PV_DB_NAME)
+            self.assertIn(os.path.normpath("PackB/sub3"), index.refresh().packs)
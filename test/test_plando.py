@@ -41,3 +41,19 @@ class TestPlando(MegaMixTestBase):
 
     def test_plando_exclude(self):
         self._test_plando(True)
+
+    def test_plando_start_inventory(self):
+        """Non-song start items are ignored, starting songs are not also included."""
+
+        world = self.get_world()
+        items = list(world.mm_collection.song_items)[0:40]
+        start = items[0:5]
+
+        world.options.start_inventory.value = {"Leek": 3, **{song: 1 for song in start}}
+        world.options.include_songs = IncludeSongs(items[0:10])
+
+        song_pool = world.handle_plando(items)
+
+        self.assertEqual(start, world.starting_songs)
+        self.assertFalse(set(start) & set(world.included_songs))
+        self.assertFalse(set(start) & set(song_pool))
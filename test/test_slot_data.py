@@ -0,0 +1,43 @@
+import unittest
+
+from test.general import setup_multiworld
+from .. import MegaMixWorld
+from ..SlotData import encode_song_ids, decode_song_ids, decode_slot_data
+
+
+class TestMultipleSlots(unittest.TestCase):
+    """Generate several Mega Mix slots together and verify their working state isn't shared."""
+
+    def test_final_song_ids_per_slot(self):
+        multiworld = setup_multiworld([MegaMixWorld] * 3)
+
+        for player, world in multiworld.worlds.items():
+            song_items = world.mm_collection.song_items
+            own_songs = {song_items[name].songID for name in
+                         world.starting_songs + world.included_songs + [world.victory_song_name]}
+            slot_data = world.interpret_slot_data(world.fill_slot_data())
+
+            self.assertEqual(own_songs, set(slot_data["finalSongIDs"]), f"Player {player}")
+
+
+class TestSongIDEncoding(unittest.TestCase):
+    """Round trip song IDs through both encodings and the version 1 lists."""
+
+    def test_round_trip(self):
+        cases = [[], [0], [1, 2, 3, 10, 12, 13], list(range(1, 300)), list(range(1, 4000, 3)), [5, 70000]]
+
+        for song_ids in cases:
+            encoded = encode_song_ids(reversed(song_ids))
+            self.assertEqual(song_ids, decode_song_ids(encoded), encoded)
+
+    def test_shorter_than_list(self):
+        song_ids = list(range(1, 1000, 2))
+        self.assertLess(len(encode_song_ids(song_ids)), len(str(song_ids)))
+
+    def test_legacy_slot_data(self):
+        slot_data = {"finalSongIDs": [3, 1, 2], "modData": {"Pack": [400, 401]}, "leekWinCount": 5}
+        decoded = decode_slot_data(slot_data)
+
+        self.assertEqual([1, 2, 3], decoded["finalSongIDs"])
+        self.assertEqual({"Pack": [400, 401]}, decoded["modData"])
+        self.assertEqual(5, decoded["leekWinCount"])
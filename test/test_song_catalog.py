@@ -0,0 +1,26 @@
+import unittest
+
+from ..Items import SongCatalog, SongData
+
+
+class TestSongCatalog(unittest.TestCase):
+    """Rows read back as the SongData they were added as."""
+
+    def test_rows(self):
+        catalog = SongCatalog([("Love is War [1]", 10, 1, ("Hatsune Miku",), False, (2.0, 4.0, 6.0, 8.0, 8.5))])
+        catalog.add("Modded [4000]", 40000, 4000, (), False, True, 0b01001_11001)
+
+        self.assertEqual(SongData(10, 1, {"Hatsune Miku"}, False, False, [2.0, 4.0, 6.0, 8.0, 8.5]),
+                         catalog["Love is War [1]"])
+        self.assertEqual(SongData(40000, 4000, set(), False, True, [0.0, 0.0, 0.0, 9.0, 9.5]),
+                         catalog.get("Modded [4000]"))
+        self.assertEqual(["Love is War [1]", "Modded [4000]"], list(catalog))
+        self.assertNotIn("Melt [5]", catalog)
+
+    def test_replace(self):
+        catalog = SongCatalog()
+        catalog.add("Song [5]", 50, 5, ("MEIKO", "KAITO"), True, False, [1.0, 0.0, 0.0, 0.0, 0.0])
+        catalog.add("Song [5]", 51, 5, ("KAITO",), False, True, [0.0, 0.0, 0.0, 0.0, 10.0])
+
+        self.assertEqual(1, len(catalog))
+        self.assertEqual(SongData(51, 5, {"KAITO"}, False, True, [0.0, 0.0, 0.0, 0.0, 10.0]), catalog["Song [5]"])
@@ -0,0 +1,92 @@
+import random
+from typing import List
+
+from Options import OptionError
+
+from . import MegaMixTestBase
+from .. import MegaMixWorld
+from ..Options import AdditionalSongs, AllowMegaMixDLCSongs, DifficultyModeMax, DifficultyModeMin, DifficultyRatingMax, \
+    DifficultyRatingMin, ExcludeSongs, GoalSongs, IncludeSongs, IncludeSongsPercentage, StartingSongs
+
+
+def widening_loop(world: MegaMixWorld) -> List[str]:
+    """The search find_song_pool replaced, running handle_plando at every step."""
+    lower_rating_threshold, higher_rating_threshold = world.get_difficulty_range()
+    lower_diff_threshold, higher_diff_threshold = world.get_available_difficulties(world.options.song_difficulty_min.value, world.options.song_difficulty_max.value)
+
+    while True:
+        allowed_difficulties = list(range(lower_diff_threshold, higher_diff_threshold + 1))
+        available_song_keys = world.mm_collection.get_songs_with_settings(world.options.allow_megamix_dlc_songs, world.player_specific_ids, allowed_difficulties, lower_rating_threshold, higher_rating_threshold)
+
+        available_song_keys = world.handle_plando(available_song_keys)
+
+        count_needed_for_start = max(0, world.options.starting_song_count.value - len(world.starting_songs)) + 11
+        if len(available_song_keys) + len(world.included_songs) >= count_needed_for_start:
+            return available_song_keys
+
+        if lower_rating_threshold <= 1 and higher_rating_threshold >= 10 and len(allowed_difficulties) >= 5:
+            raise OptionError("Failed to find enough songs, even with maximum difficulty thresholds.")
+        elif lower_rating_threshold <= 1:
+            if higher_rating_threshold > 10:
+                lower_rating_threshold, higher_rating_threshold = world.get_difficulty_range()
+
+                if lower_diff_threshold <= 0 and higher_diff_threshold < 4: higher_diff_threshold += 1
+                if lower_diff_threshold > 0: lower_diff_threshold -= 1
+
+                lower_diff_threshold, higher_diff_threshold = world.get_available_difficulties(lower_diff_threshold, higher_diff_threshold)
+            else:
+                higher_rating_threshold += 0.5
+        else:
+            lower_rating_threshold -= 0.5
+
+
+class TestSongPoolSearch(MegaMixTestBase):
+    """find_song_pool skips search steps by counting. Seeds must play out the same as trying each step."""
+    cases = 500
+
+    def random_options(self, rng: random.Random) -> None:
+        world = self.get_world()
+        songs = sorted(key for key, song in world.mm_collection.song_items.items() if not song.modded)
+
+        def pick(*counts: int) -> List[str]:
+            return rng.sample(songs, rng.choice(counts))
+
+        # Mostly narrow criteria without plando, the cases the shortcut skips steps for
+        world.options.starting_song_count = StartingSongs(rng.randint(StartingSongs.range_start, StartingSongs.range_end))
+        world.options.additional_song_count = AdditionalSongs(rng.randint(AdditionalSongs.range_start, 400))
+        world.options.allow_megamix_dlc_songs = AllowMegaMixDLCSongs(rng.random() < 0.5)
+        world.options.song_difficulty_min = DifficultyModeMin(rng.randint(0, 4))
+        world.options.song_difficulty_max = DifficultyModeMax(rng.randint(0, 4))
+        world.options.song_difficulty_rating_min = DifficultyRatingMin(rng.randint(0, 18))
+        world.options.song_difficulty_rating_max = DifficultyRatingMax(rng.randint(0, 18))
+        world.options.start_inventory.value = {song: 1 for song in pick(0, 0, 2, 10)}
+        world.options.include_songs = IncludeSongs(pick(0, 0, 0, 5, 40))
+        world.options.include_songs_percentage = IncludeSongsPercentage(rng.choice([100, 100, 0, 30]))
+        world.options.exclude_songs = ExcludeSongs(pick(0, 0, 10, 200))
+        world.options.goal_song = GoalSongs(pick(0, 0, 0, 3))
+
+    def run_search(self, search, seed: float) -> tuple:
+        world = self.get_world()
+        world.random = random.Random(seed)
+        world.victory_song_name = ""
+        world.starting_songs = []
+        world.included_songs = []
+        world.final_song_ids = set()
+
+        try:
+            pool = search(world)
+        except OptionError:
+            return "OptionError", world.random.getstate()
+
+        world.create_song_pool(pool)
+        return world.starting_songs, world.included_songs, world.victory_song_name, pool, world.random.getstate()
+
+    def test_same_as_widening_loop(self):
+        rng = random.Random(0)
+        for case in range(self.cases):
+            self.random_options(rng)
+            seed = rng.random()
+
+            with self.subTest(case=case):
+                self.assertEqual(self.run_search(widening_loop, seed),
+                                 self.run_search(MegaMixWorld.find_song_pool, seed))